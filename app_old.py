@@ -1,17 +1,20 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import io
 import json
+import os
 import time
-from scraper import FundingScraper
-from ai_processor import AIProcessor
-from data_manager import DataManager
-from predictive_analytics import PredictiveAnalytics, analyze_market_trends, generate_funding_predictions, identify_investment_gaps, create_predictive_visualizations
-from utils import format_currency, format_date
+from sources.deployment_scraper import DeploymentReadyScraper
+from core.ai_processor import AIProcessor
+from data.data_manager import DataManager
+from core.predictive_analytics import PredictiveAnalytics, analyze_market_trends, generate_funding_predictions, identify_investment_gaps, create_predictive_visualizations
+from utils import format_currency, format_currency_series, format_date_series, minify_css, compact_funding_frame, float64_amounts, ARROW_STRING_DTYPE
 import config
-from vc_sample_data import create_focused_vc_sample_data
+from data.vc_sample_data import create_focused_vc_sample_data
 
 # Configure page
 st.set_page_config(
@@ -22,7 +25,10 @@ st.set_page_config(
 )
 
 # Enhanced modern art botanical design system
-st.markdown("""
+@st.cache_resource
+def app_stylesheet() -> str:
+    """Minified once per process; the script body reruns on every interaction"""
+    return minify_css("""
 <style>
     /* Import modern eco-conscious fonts */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@200;300;400;500;600;700&family=JetBrains+Mono:wght@300;400;500&family=Crimson+Text:ital,wght@0,400;0,600;1,400&display=swap');
@@ -412,6 +418,20 @@ st.markdown("""
         margin: 1rem 0;
     }
     
+    /* AI insight section headers; the accent comes from --accent per section */
+    .insight-banner {
+        background: linear-gradient(135deg, rgba(168, 218, 220, 0.1) 0%, rgba(241, 250, 238, 0.8) 100%);
+        border-radius: 15px;
+        padding: 20px;
+        margin: 10px 0;
+        border-left: 4px solid var(--accent, #52796F);
+    }
+    
+    .insight-banner h3 {
+        color: #1B4332;
+        margin-bottom: 15px;
+    }
+    
     /* Loading spinner customization */
     .stSpinner > div {
         border-top-color: var(--sage-green) !important;
@@ -426,141 +446,490 @@ st.markdown("""
         background-color: var(--forest-green);
     }
 </style>
-""", unsafe_allow_html=True)
+""")
+
+st.markdown(app_stylesheet(), unsafe_allow_html=True)
+
+# Text columns matched by the sidebar search box
+SEARCH_COLUMNS = ['company', 'sector', 'stage', 'lead_investor', 'location', 'description']
+
+# Row counts offered by the Deal List pager
+DEAL_LIST_PAGE_SIZES = [25, 50, 100, 250]
+
+# Rows serialized per write when exporting CSV
+EXPORT_CHUNK_ROWS = 10_000
+
+# Point count above which charts switch from SVG to WebGL (plotly express uses the same cutoff
+# for render_mode='auto' on scatter and line, which the region scatter and trend lines rely on)
+WEBGL_MIN_POINTS = 1000
+
+# Days above which the funding timeline is coarsened to weeks, then months: (resample rule, title prefix)
+TIMELINE_MAX_POINTS = 2000
+TIMELINE_COARSENING = [('W', 'Weekly'), ('MS', 'Monthly')]
+
+# Dashboard sections, one rendered per run
+DASHBOARD_VIEWS = ["📊 Analytics", "📋 Deal List", "🤖 AI Insights", "📈 Trends", "🔮 Predictive Analytics"]
 
-# Initialize components
+# AI insight sections: (insights key, header, accent colour, text when missing; None skips the section)
+INSIGHT_SECTIONS = [
+    ('trends', "🌱 Key Market Trends", '#52796F', 'No trends identified'),
+    ('opportunities', "💡 Investment Opportunities", '#457B9D', 'No opportunities identified'),
+    ('analysis', "📊 Market Analysis", '#8B4513', 'No analysis available'),
+    ('recommendations', "🎯 Strategic Recommendations", '#F4A261', None),
+    ('risk_factors', "⚠️ Risk Factors", '#E76F51', None),
+]
+
+# Botanical chart theme shared by the Analytics figures
+CHART_LAYOUT = dict(
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(family="Inter, sans-serif", color='#1B4332'),
+    title_font_size=16
+)
+CHART_PLOT_BGCOLOR = 'rgba(241, 250, 238, 0.8)'
+CHART_AXIS = dict(
+    gridcolor='rgba(168, 218, 220, 0.5)',
+    linecolor='#52796F',
+    tickcolor='#52796F'
+)
+
+# Initialize components: one shared instance each, so any one can be rebuilt with .clear() on its own
 @st.cache_resource
-def init_components():
-    return FundingScraper(), AIProcessor(), DataManager()
+def get_scraper() -> DeploymentReadyScraper:
+    return DeploymentReadyScraper()
 
-def main():
-    scraper, ai_processor, data_manager = init_components()
+@st.cache_resource
+def get_ai_processor() -> AIProcessor:
+    return AIProcessor()
+
+@st.cache_resource
+def get_data_manager() -> DataManager:
+    return DataManager()
+
+def load_typed_funding_data(file_mtime: float) -> pd.DataFrame:
+    """
+    Load and type the funding data once per file version
+    file_mtime is the cache key: a new save changes it and invalidates the cached frame
+    """
+    # Shallow copy: callers only slice or add columns, never edit the shared values in place
+    return _typed_funding_frame(file_mtime).copy(deep=False)
+
+@st.cache_resource(max_entries=2)
+def _typed_funding_frame(file_mtime: float) -> pd.DataFrame:
+    """Shared typed frame; cache_resource hands back the object itself instead of unpickling a copy each rerun"""
+    df = DataManager().load_funding_data()
+    if df.empty:
+        return df
     
-    # Add floating elements for immersive experience
-    st.markdown("""
-    <div class="floating-element">🌱</div>
-    <div class="floating-element">🍃</div>
-    <div class="floating-element">🌿</div>
-    """, unsafe_allow_html=True)
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        # Date-sorted (NaT last) so the date filter is a binary search instead of a full comparison
+        df = df.sort_values('date', kind='stable', na_position='last', ignore_index=True)
+    return compact_funding_frame(df)
+
+@st.cache_resource(max_entries=2)
+def load_search_text(file_mtime: float) -> pd.Series:
+    """
+    Lowercased SEARCH_COLUMNS joined per row, built once per data version
+    Row-aligned with load_typed_funding_data, so one substring pass replaces one per column
+    """
+    df = _typed_funding_frame(file_mtime)
+    columns = [c for c in SEARCH_COLUMNS if c in df.columns]
+    if df.empty or not columns:
+        return pd.Series('', index=df.index)
     
-    # Enhanced header with focused VC positioning
-    st.markdown('<h1 class="botanical-header">⚡ VC Deal Flow Tracker</h1>', unsafe_allow_html=True)
-    st.markdown("""
-    <div class="glass-container">
-        <p style="margin: 0; font-style: italic; color: var(--sage-green); font-size: 1.1rem;">
-            Precision intelligence for climate tech investors
-        </p>
-        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: var(--soft-gray);">
-            Grid Modernization & Carbon Capture • Seed & Series A • Weekly Deal Reports
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    parts = [df[c].astype(str).where(df[c].notna(), '') for c in columns]
+    # Unit separator keeps a match from spanning two fields
+    # Arrow-backed, so each search's str.contains runs pyarrow's substring kernel rather than a Python loop
+    return parts[0].str.cat(parts[1:], sep='\x1f').str.lower().astype(ARROW_STRING_DTYPE)
+
+def category_choices(series: pd.Series) -> list:
+    """Sorted distinct labels of a column; categoricals read them off their categories instead of scanning rows"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categories built from strings are already sorted; dropping unused ones is a pass over the int codes
+        return series.cat.remove_unused_categories().cat.categories.tolist()
+    return sorted(series.dropna().unique().tolist())
+
+@st.cache_data
+def load_filter_options(file_mtime: float) -> dict:
+    """Sidebar choices and amount bounds for one data version, computed once on the unfiltered data"""
+    df = load_typed_funding_data(file_mtime)
+    options = {
+        column: category_choices(df[column]) if column in df.columns else []
+        for column in ('sector', 'stage', 'region')
+    }
+    # min/max skip missing values and return NaN/NaT for an all-missing column, so no separate isna().all() scan
+    amount_min = df['amount'].min() if 'amount' in df.columns else np.nan
+    has_amounts = pd.notna(amount_min)
+    options['amount_min'] = float(amount_min) if has_amounts else None
+    options['amount_max'] = float(df['amount'].max()) if has_amounts else None
+    date_min = df['date'].min() if 'date' in df.columns else pd.NaT
+    has_dates = pd.notna(date_min)
+    options['date_min'] = date_min.date() if has_dates else None
+    options['date_max'] = df['date'].max().date() if has_dates else None
+    return options
+
+def funding_file_mtime(data_manager: DataManager) -> float:
+    """Modification time of the funding CSV, or 0 when it does not exist yet"""
+    path = data_manager.funding_file
+    return os.path.getmtime(path) if os.path.exists(path) else 0.0
+
+# Month key of an undated row once dates are cast to int64 months
+NAT_MONTH = np.iinfo(np.int64).min
+
+def month_labels(months: pd.Series) -> np.ndarray:
+    """'YYYY-MM' labels for int64 months-since-epoch keys"""
+    return months.to_numpy().astype('datetime64[M]').astype(str)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def market_insights(file_mtime: float, filter_key: tuple, _ai_processor: AIProcessor, _df: pd.DataFrame) -> dict:
+    """LLM market insights for one filtered view; repeat clicks on unchanged data skip the LLM call"""
+    insights = _ai_processor.generate_market_insights(_df)
+    if not insights:
+        # Raised rather than returned so a failed call is not cached
+        raise RuntimeError("Unable to generate insights at this time")
+    return insights
+
+@st.cache_data(max_entries=8)
+def export_bytes(file_mtime: float, filter_key: tuple, export_format: str, _df: pd.DataFrame) -> bytes:
+    """Filtered rows serialized for download, keyed like compute_aggregations instead of hashing the frame"""
+    # Serialized straight into one bytes buffer rather than an intermediate str
+    buffer = io.BytesIO()
+    if export_format == "CSV":
+        _df.to_csv(buffer, index=False, chunksize=EXPORT_CHUNK_ROWS)
+    else:
+        # Unindented: indent=2 roughly doubled the payload for the same records
+        _df.to_json(buffer, orient='records', date_format='iso')
+    return buffer.getvalue()
+
+@st.cache_data
+def compute_aggregations(file_mtime: float, filter_key: tuple, _df: pd.DataFrame) -> dict:
+    """
+    Every grouped series the Analytics and Trends tabs plot, computed once per filtered frame
+    Cached on the data version and filter values (cheap to hash); _df itself is not hashed
+    """
+    df = float64_amounts(_df)
+    # Non-null count per column, one pass; the chart guards read this instead of rescanning
+    aggs = {'nonnull': df.notna().sum().to_dict()}
     
-    # Sidebar
-    with st.sidebar:
-        st.header("Controls")
-        
-        # Enhanced data collection with APITest2 integration
-        st.subheader("⚡ Enhanced Deal Collection")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("🔄 Enhanced Scan", type="primary"):
-                with st.spinner("Scanning with enhanced APITest2 integration..."):
-                    try:
-                        # Use enhanced scraper with APITest2 functionality
-                        raw_data = scraper.scrape_all_sources()
-                        if raw_data:
-                            # Process with focused AI
-                            processed_data = []
-                            for item in raw_data:
-                                processed_item = ai_processor.process_funding_event(item)
-                                if processed_item and processed_item.get('is_target_deal', False):
-                                    processed_data.append(processed_item)
-                            
-                            # Save to storage
-                            if processed_data:
-                                data_manager.save_funding_data(processed_data)
-                                st.success(f"✅ Found {len(processed_data)} new Grid Modernization & Carbon Capture deals")
-                                st.rerun()
-                            else:
-                                st.warning("No new target deals found in current scan")
-                        else:
-                            st.warning("No new data found from enhanced sources")
-                    except Exception as e:
-                        st.error(f"Enhanced scan error: {str(e)}")
-        
-        with col2:
-            if st.button("📊 Load VC Deals"):
-                with st.spinner("Loading focused VC deal data..."):
-                    try:
-                        sample_data = create_focused_vc_sample_data()
-                        data_manager.save_funding_data(sample_data)
-                        st.success(f"✅ Loaded {len(sample_data)} Grid Modernization & Carbon Capture deals")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error loading VC deal data: {str(e)}")
-        
-        # Auto-refresh toggle
-        auto_refresh = st.toggle("Auto-refresh (30 min)", value=False)
-        
-        # Export section
-        st.subheader("Export Data")
-        export_format = st.selectbox("Format", ["CSV", "JSON"])
+    # Headline metrics; the average is over all filtered deals, as the metric card has always shown
+    total_funding = float(df['amount'].sum()) if 'amount' in df.columns else 0.0
+    aggs['metrics'] = {
+        'total_funding': total_funding,
+        'deal_count': len(df),
+        'avg_deal_size': total_funding / len(df) if len(df) > 0 else 0,
+        'unique_investors': int(df['lead_investor'].nunique()) if 'lead_investor' in df.columns else 0
+    }
+    
+    # Groupbys skip the pre-sort (sort=False); only the few output rows whose order
+    # a chart depends on are sorted afterwards
+    if 'sector' in df.columns:
+        aggs['by_sector'] = df.groupby('sector', observed=True, sort=False)['amount'].sum().reset_index()
+    if 'stage' in df.columns:
+        aggs['by_stage'] = (df.groupby('stage', observed=True, sort=False)['amount'].sum()
+                            .sort_index().reset_index())
+    if 'region' in df.columns:
+        aggs['by_region'] = df.groupby('region', observed=True, sort=False).agg(
+            total_funding=('amount', 'sum'),
+            deal_count=('company', 'count')
+        ).reset_index()
+    if 'date' in df.columns:
+        # normalize() bins on the int64 timestamps; only days with deals get a row, as before
+        by_day = (df.groupby(df['date'].dt.normalize(), sort=False)['amount'].sum()
+                  .sort_index().reset_index())
+        aggs['timeline_period'] = 'Daily'
+        # Long histories are summed into coarser periods so the chart draws a bounded number of points
+        for rule, period in TIMELINE_COARSENING:
+            if len(by_day) <= TIMELINE_MAX_POINTS:
+                break
+            resampled = by_day.set_index('date')['amount'].resample(rule)
+            # Periods without a deal day are dropped, matching the daily series
+            by_day = resampled.sum()[resampled.count() > 0].reset_index()
+            aggs['timeline_period'] = period
+        aggs['by_day'] = by_day
         
-        # Filters
-        st.subheader("Filters")
+        # int64 months since epoch; undated rows share the NaT sentinel and are dropped after grouping
+        month = pd.Series(df['date'].to_numpy().astype('datetime64[M]').view('int64'), index=df.index, name='month')
+        if 'sector' in df.columns:
+            # One (month, sector) pass feeds both trend tables; dropna=False keeps deals without a sector in the monthly totals
+            month_sector = (df.groupby([month, 'sector'], observed=True, sort=False, dropna=False)['amount']
+                            .agg(['sum', 'count']).drop(index=NAT_MONTH, level='month', errors='ignore'))
+            by_month = month_sector.groupby(level='month', sort=False).sum()
+            
+            labelled = month_sector.index.get_level_values('sector').notna()
+            by_month_sector = month_sector.loc[labelled, 'sum'].rename('amount').sort_index().reset_index()
+            by_month_sector['month'] = month_labels(by_month_sector['month'])
+            aggs['by_month_sector'] = by_month_sector
+        else:
+            by_month = df.groupby(month, sort=False)['amount'].agg(['sum', 'count']).drop(index=NAT_MONTH, errors='ignore')
         
-    # Load existing data
+        # Mean is derived from sum and count rather than running a third groupby kernel
+        by_month = by_month.sort_index().reset_index()
+        by_month.columns = ['month', 'total_funding', 'deal_count']
+        by_month['avg_deal_size'] = by_month['total_funding'] / by_month['deal_count']
+        by_month['month'] = month_labels(by_month['month'])
+        aggs['by_month'] = by_month
+    return aggs
+
+# Figures are cached as plain dicts on the small aggregated frame that feeds them, so tab
+# switches and unrelated widget changes skip Plotly Express trace building and layout merging
+
+@st.cache_data
+def sector_pie_figure(sector_data: pd.DataFrame) -> dict:
+    """Sector share pie for the Analytics tab"""
+    # Botanical color palette for sectors
+    sector_colors = [
+        '#1B4332', '#52796F', '#A8DADC', '#457B9D', '#8B4513',
+        '#E76F51', '#F4A261', '#6C7B7F', '#2D6A4F', '#74C69D'
+    ]
+    
+    fig = px.pie(
+        sector_data, 
+        values='amount', 
+        names='sector',
+        title="Distribution of Funding by Sector",
+        color_discrete_sequence=sector_colors
+    )
+    fig.update_traces(
+        textposition='inside', 
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>Amount: %{value:$,.0f}<br>Percentage: %{percent}<extra></extra>'
+    )
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        showlegend=True,
+        legend=dict(orientation="v", x=1.05),
+        **CHART_LAYOUT
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def stage_bar_figure(stage_data: pd.DataFrame) -> dict:
+    """Funding-by-stage bar chart for the Analytics tab"""
+    fig = px.bar(
+        stage_data,
+        x='stage',
+        y='amount',
+        title="Funding Amount by Stage",
+        color='amount',
+        color_continuous_scale=['#A8DADC', '#52796F', '#1B4332']
+    )
+    fig.update_layout(
+        plot_bgcolor=CHART_PLOT_BGCOLOR,
+        xaxis_title="Funding Stage",
+        yaxis_title="Amount (USD)",
+        xaxis=CHART_AXIS,
+        yaxis=CHART_AXIS,
+        **CHART_LAYOUT
+    )
+    fig.update_traces(
+        hovertemplate='<b>%{x}</b><br>Total Funding: $%{y:,.0f}<extra></extra>',
+        marker_line_color='#52796F',
+        marker_line_width=1
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def timeline_figure(timeline_data: pd.DataFrame, period: str = 'Daily') -> dict:
+    """Funding area chart for the Analytics tab; period names the bucket size (Daily, Weekly, Monthly)"""
+    if len(timeline_data) > WEBGL_MIN_POINTS:
+        # Long histories render through WebGL; scattergl has no spline, so the line is straight
+        fig = px.line(
+            timeline_data,
+            x='date',
+            y='amount',
+            title=f"{period} Funding Activity",
+            render_mode='webgl'
+        )
+    else:
+        fig = px.area(
+            timeline_data,
+            x='date',
+            y='amount',
+            title=f"{period} Funding Activity",
+            line_shape='spline'
+        )
+    fig.update_traces(
+        line_color='#1B4332',
+        fill='tozeroy',
+        fillcolor='rgba(168, 218, 220, 0.3)',
+        hovertemplate='<b>%{x}</b><br>Total Funding: $%{y:,.0f}<extra></extra>'
+    )
+    fig.update_layout(
+        plot_bgcolor=CHART_PLOT_BGCOLOR,
+        xaxis_title="Date",
+        yaxis_title="Amount (USD)",
+        xaxis=CHART_AXIS,
+        yaxis=CHART_AXIS,
+        **CHART_LAYOUT
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def region_scatter_figure(geo_data: pd.DataFrame) -> dict:
+    """Deals vs funding scatter by region for the Analytics tab"""
+    fig = px.scatter(
+        geo_data,
+        x='deal_count',
+        y='total_funding',
+        size='total_funding',
+        color='total_funding',
+        hover_data=['region'],
+        title="Deals vs Funding by Region",
+        color_continuous_scale=['#A8DADC', '#52796F', '#1B4332'],
+        size_max=60
+    )
+    fig.update_traces(
+        hovertemplate='<b>%{customdata[0]}</b><br>Deals: %{x}<br>Total Funding: $%{y:,.0f}<extra></extra>',
+        marker_line_color='#52796F',
+        marker_line_width=1
+    )
+    fig.update_layout(
+        plot_bgcolor=CHART_PLOT_BGCOLOR,
+        xaxis_title="Number of Deals",
+        yaxis_title="Total Funding (USD)",
+        xaxis=CHART_AXIS,
+        yaxis=CHART_AXIS,
+        **CHART_LAYOUT
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def monthly_volume_figure(monthly_data: pd.DataFrame) -> dict:
+    """Monthly funding volume bar chart for the Trends tab"""
+    fig = px.bar(
+        monthly_data,
+        x='month',
+        y='total_funding',
+        title="Monthly Funding Volume"
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def avg_deal_size_figure(monthly_data: pd.DataFrame) -> dict:
+    """Monthly average deal size line for the Trends tab"""
+    fig = px.line(
+        monthly_data,
+        x='month',
+        y='avg_deal_size',
+        title="Average Deal Size Trend"
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def sector_trends_figure(sector_trends: pd.DataFrame) -> dict:
+    """Monthly funding by sector lines for the Trends tab"""
+    fig = px.line(
+        sector_trends,
+        x='month',
+        y='amount',
+        color='sector',
+        title="Funding Trends by Sector"
+    )
+    return fig.to_dict()
+
+def insight_banner(title: str, accent: str, body: str):
+    """AI insight section: a small .insight-banner header element followed by the markdown body"""
+    st.markdown(f'<div class="insight-banner" style="--accent: {accent}"><h3>{title}</h3></div>', unsafe_allow_html=True)
+    st.markdown(body)
+
+@st.fragment
+def market_insights_panel(df: pd.DataFrame, file_mtime: float, filter_key: tuple):
+    """
+    Generate Insights button and the last insights for this view
+    Its own fragment, so a click reruns only this panel rather than the filters, metrics and views around it
+    """
+    # Insights are cached per data version and filters; the last result stays on screen across reruns
+    insight_key = (file_mtime, filter_key)
+    if st.button("🤖 Generate Insights", type="primary"):
+        with st.spinner("🌱 Analyzing market trends with AI..."):
+            try:
+                st.session_state['market_insights'] = (
+                    insight_key, market_insights(file_mtime, filter_key, get_ai_processor(), df)
+                )
+            except Exception as e:
+                st.error(f"Error generating insights: {str(e)}")
+    
+    stored = st.session_state.get('market_insights')
+    if stored and stored[0] == insight_key:
+        insights = stored[1]
+        # One styled header plus the markdown body per section; optional sections without content are skipped
+        for key, title, accent, fallback in INSIGHT_SECTIONS:
+            body = insights.get(key) or fallback
+            if body:
+                insight_banner(title, accent, body)
+
+@st.fragment(run_every=config.AUTO_REFRESH_INTERVAL)
+def auto_refresh_timer():
+    """
+    Rerun the whole app every AUTO_REFRESH_INTERVAL seconds
+    The fragment timer is driven by the browser, so no script thread sleeps while waiting
+    """
+    # The fragment also runs inline on every full rerun; only a timer tick past the interval refreshes
+    if time.time() - st.session_state.get('last_app_run', 0) >= config.AUTO_REFRESH_INTERVAL:
+        st.rerun()
+
+@st.fragment
+def render_dashboard(df: pd.DataFrame, file_mtime: float):
+    """
+    Filters, metrics and tabs for the loaded data
+    A fragment: its widgets rerun only this function, not data loading or the sidebar controls
+    """
     try:
-        df = data_manager.load_funding_data()
-        
-        if df.empty:
-            st.info("📊 No deal data available. Click 'Load VC Deals' to see Grid Modernization & Carbon Capture funding events.")
-            return
-        
-        # Apply filters in sidebar
-        with st.sidebar:
+        # Filters render inside the fragment so widget changes only rerun the dashboard
+        filter_options = load_filter_options(file_mtime)
+        with st.expander("🎯 Filters & Export", expanded=True):
+            # Every active filter ANDs into one mask; the frame is sliced once at the end
+            mask = np.ones(len(df), dtype=bool)
+            # Widget values that shaped the mask, in order; keys the cached aggregations
+            filter_key = []
+            
             # Date range filter
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
-                min_date = df['date'].min().date()
-                max_date = df['date'].max().date()
+            if filter_options['date_min'] is not None:
+                min_date = filter_options['date_min']
+                max_date = filter_options['date_max']
                 date_range = st.date_input(
                     "Date Range",
                     value=(min_date, max_date),
                     min_value=min_date,
                     max_value=max_date
                 )
+                filter_key.append(tuple(date_range))
                 if len(date_range) == 2:
-                    df = df[(df['date'].dt.date >= date_range[0]) & 
-                           (df['date'].dt.date <= date_range[1])]
+                    # The frame is date-sorted, so the range is one contiguous block; the end date includes its whole day
+                    lo, hi = df['date'].to_numpy().searchsorted(
+                        [np.datetime64(date_range[0]), np.datetime64(date_range[1] + timedelta(days=1))]
+                    )
+                    mask[:lo] = False
+                    mask[hi:] = False
             
             # Target Subsector filter (focused VC use case)
             if 'sector' in df.columns:
-                sectors = ['All'] + sorted(df['sector'].dropna().unique().tolist())
+                sectors = ['All'] + filter_options['sector']
                 selected_sector = st.selectbox("Target Subsector", sectors, help="Grid Modernization & Carbon Capture only")
+                filter_key.append(selected_sector)
                 if selected_sector != 'All':
-                    df = df[df['sector'] == selected_sector]
+                    mask &= (df['sector'] == selected_sector).to_numpy()
             
             # Funding Stage filter (focused on Seed & Series A)
             if 'stage' in df.columns:
-                stages = ['All'] + sorted(df['stage'].dropna().unique().tolist())
+                stages = ['All'] + filter_options['stage']
                 selected_stage = st.selectbox("Funding Stage", stages, help="Focused on Seed & Series A rounds")
+                filter_key.append(selected_stage)
                 if selected_stage != 'All':
-                    df = df[df['stage'] == selected_stage]
+                    mask &= (df['stage'] == selected_stage).to_numpy()
             
             # Region filter
             if 'region' in df.columns:
-                regions = ['All'] + sorted(df['region'].dropna().unique().tolist())
+                regions = ['All'] + filter_options['region']
                 selected_region = st.selectbox("Region", regions)
+                filter_key.append(selected_region)
                 if selected_region != 'All':
-                    df = df[df['region'] == selected_region]
+                    mask &= (df['region'] == selected_region).to_numpy()
             
             # Amount range filter
-            if 'amount' in df.columns and not df['amount'].isna().all():
-                min_amount = float(df['amount'].min())
-                max_amount = float(df['amount'].max())
+            if filter_options['amount_min'] is not None:
+                min_amount = filter_options['amount_min']
+                max_amount = filter_options['amount_max']
                 amount_range = st.slider(
                     "Funding Amount (M USD)",
                     min_value=min_amount/1000000,
@@ -568,37 +937,37 @@ def main():
                     value=(min_amount/1000000, max_amount/1000000),
                     step=0.1
                 )
-                df = df[(df['amount'] >= amount_range[0]*1000000) & 
-                       (df['amount'] <= amount_range[1]*1000000)]
+                filter_key.append(tuple(amount_range))
+                amounts = df['amount'].to_numpy()
+                # Each bound ANDs straight into the mask; no combined temporary for the range
+                mask &= amounts >= amount_range[0]*1000000
+                mask &= amounts <= amount_range[1]*1000000
             
             # Search
             search_term = st.text_input("🔍 Search companies, investors...")
+            filter_key.append(search_term)
             if search_term:
-                mask = df.apply(lambda row: row.astype(str).str.contains(
-                    search_term, case=False, na=False).any(), axis=1)
-                df = df[mask]
+                # One literal match over the cached lowercase text of every search column,
+                # scanning only the rows the other filters kept
+                search_text = load_search_text(file_mtime)
+                rows = np.flatnonzero(mask)
+                mask[rows] = search_text.iloc[rows].str.contains(search_term.lower(), na=False, regex=False).to_numpy()
             
-            # Export button
-            if st.button("📥 Export Filtered Data"):
-                try:
-                    if export_format == "CSV":
-                        csv = df.to_csv(index=False)
-                        st.download_button(
-                            label="Download CSV",
-                            data=csv,
-                            file_name=f"climate_funding_{datetime.now().strftime('%Y%m%d')}.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        json_data = df.to_json(orient='records', indent=2)
-                        st.download_button(
-                            label="Download JSON",
-                            data=json_data,
-                            file_name=f"climate_funding_{datetime.now().strftime('%Y%m%d')}.json",
-                            mime="application/json"
-                        )
-                except Exception as e:
-                    st.error(f"Export error: {str(e)}")
+            df = df.loc[mask]
+            
+            # Export: a single download button; the bytes are cached per data version, filters and format
+            export_format = st.selectbox("Export format", ["CSV", "JSON"])
+            try:
+                extension, mime = ("csv", "text/csv") if export_format == "CSV" else ("json", "application/json")
+                st.download_button(
+                    label=f"📥 Download {export_format}",
+                    data=export_bytes(file_mtime, tuple(filter_key), export_format, df),
+                    file_name=f"climate_funding_{datetime.now().strftime('%Y%m%d')}.{extension}",
+                    mime=mime,
+                    on_click="ignore"
+                )
+            except Exception as e:
+                st.error(f"Export error: {str(e)}")
         
         # Enhanced main dashboard with immersive design
         if not df.empty:
@@ -614,211 +983,99 @@ def main():
             </div>
             """, unsafe_allow_html=True)
             
+            # Headline metrics come with the cached aggregations, keyed on the same filters
+            aggs = compute_aggregations(file_mtime, tuple(filter_key), df)
+            metrics = aggs['metrics']
+            
             # Floating metric pods
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                total_funding = df['amount'].sum() if 'amount' in df.columns else 0
                 st.metric(
                     "💰 Total Deal Volume",
-                    format_currency(total_funding),
+                    format_currency(metrics['total_funding']),
                     help="Combined funding in filtered deals"
                 )
             
             with col2:
-                deal_count = len(df)
                 st.metric(
                     "📊 Deal Count", 
-                    deal_count,
+                    metrics['deal_count'],
                     help="Number of qualifying deals in timeframe"
                 )
             
             with col3:
-                avg_deal = total_funding / deal_count if deal_count > 0 else 0
                 st.metric(
                     "📈 Avg Round Size",
-                    format_currency(avg_deal),
+                    format_currency(metrics['avg_deal_size']),
                     help="Average funding amount per deal"
                 )
             
             with col4:
-                unique_investors = df['lead_investor'].nunique() if 'lead_investor' in df.columns else 0
                 st.metric(
                     "Active Investors",
-                    unique_investors,
+                    metrics['unique_investors'],
                     help="Number of unique lead investors"
                 )
             
             # Enhanced tabs with predictive analytics
-            tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Analytics", "📋 Deal List", "🤖 AI Insights", "📈 Trends", "🔮 Predictive Analytics"])
+            # A radio rather than st.tabs: every tab body runs on each rerun, only the selected view does here
+            view = st.radio("View", DASHBOARD_VIEWS, horizontal=True, key="active_view", label_visibility="collapsed")
             
-            with tab1:
+            if view == DASHBOARD_VIEWS[0]:
                 # Visualizations
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    if 'sector' in df.columns and not df['sector'].isna().all():
+                    if aggs['nonnull'].get('sector', 0) > 0:
                         st.subheader("🌱 Funding by Sector")
-                        sector_data = df.groupby('sector')['amount'].sum().reset_index()
+                        sector_data = aggs['by_sector']
                         
-                        # Botanical color palette for sectors
-                        sector_colors = [
-                            '#1B4332', '#52796F', '#A8DADC', '#457B9D', '#8B4513',
-                            '#E76F51', '#F4A261', '#6C7B7F', '#2D6A4F', '#74C69D'
-                        ]
-                        
-                        fig = px.pie(
-                            sector_data, 
-                            values='amount', 
-                            names='sector',
-                            title="Distribution of Funding by Sector",
-                            color_discrete_sequence=sector_colors
-                        )
-                        fig.update_traces(
-                            textposition='inside', 
-                            textinfo='percent+label',
-                            hovertemplate='<b>%{label}</b><br>Amount: %{value:$,.0f}<br>Percentage: %{percent}<extra></extra>'
-                        )
-                        fig.update_layout(
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(0,0,0,0)',
-                            font=dict(family="Inter, sans-serif", color='#1B4332'),
-                            title_font_size=16,
-                            showlegend=True,
-                            legend=dict(orientation="v", x=1.05)
-                        )
+                        fig = sector_pie_figure(sector_data)
                         st.plotly_chart(fig, use_container_width=True)
                 
                 with col2:
-                    if 'stage' in df.columns and not df['stage'].isna().all():
+                    if aggs['nonnull'].get('stage', 0) > 0:
                         st.subheader("🌿 Funding by Stage")
-                        stage_data = df.groupby('stage')['amount'].sum().reset_index()
+                        stage_data = aggs['by_stage']
                         
-                        fig = px.bar(
-                            stage_data,
-                            x='stage',
-                            y='amount',
-                            title="Funding Amount by Stage",
-                            color='amount',
-                            color_continuous_scale=['#A8DADC', '#52796F', '#1B4332']
-                        )
-                        fig.update_layout(
-                            plot_bgcolor='rgba(241, 250, 238, 0.8)',
-                            paper_bgcolor='rgba(0,0,0,0)',
-                            xaxis_title="Funding Stage",
-                            yaxis_title="Amount (USD)",
-                            xaxis=dict(
-                                gridcolor='rgba(168, 218, 220, 0.5)',
-                                linecolor='#52796F',
-                                tickcolor='#52796F'
-                            ),
-                            yaxis=dict(
-                                gridcolor='rgba(168, 218, 220, 0.5)',
-                                linecolor='#52796F',
-                                tickcolor='#52796F'
-                            ),
-                            font=dict(family="Inter, sans-serif", color='#1B4332'),
-                            title_font_size=16
-                        )
-                        fig.update_traces(
-                            hovertemplate='<b>%{x}</b><br>Total Funding: $%{y:,.0f}<extra></extra>',
-                            marker_line_color='#52796F',
-                            marker_line_width=1
-                        )
+                        fig = stage_bar_figure(stage_data)
                         st.plotly_chart(fig, use_container_width=True)
                 
                 # Timeline chart
-                if 'date' in df.columns and not df['date'].isna().all():
+                if aggs['nonnull'].get('date', 0) > 0:
                     st.subheader("📈 Funding Timeline")
-                    timeline_data = df.groupby(df['date'].dt.date)['amount'].sum().reset_index()
+                    timeline_data = aggs['by_day']
                     
-                    fig = px.area(
-                        timeline_data,
-                        x='date',
-                        y='amount',
-                        title="Daily Funding Activity",
-                        line_shape='spline'
-                    )
-                    fig.update_traces(
-                        line_color='#1B4332',
-                        fill='tonexty',
-                        fillcolor='rgba(168, 218, 220, 0.3)',
-                        hovertemplate='<b>%{x}</b><br>Total Funding: $%{y:,.0f}<extra></extra>'
-                    )
-                    fig.update_layout(
-                        plot_bgcolor='rgba(241, 250, 238, 0.8)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        xaxis_title="Date",
-                        yaxis_title="Amount (USD)",
-                        xaxis=dict(
-                            gridcolor='rgba(168, 218, 220, 0.5)',
-                            linecolor='#52796F',
-                            tickcolor='#52796F'
-                        ),
-                        yaxis=dict(
-                            gridcolor='rgba(168, 218, 220, 0.5)',
-                            linecolor='#52796F',
-                            tickcolor='#52796F'
-                        ),
-                        font=dict(family="Inter, sans-serif", color='#1B4332'),
-                        title_font_size=16
-                    )
+                    fig = timeline_figure(timeline_data, aggs['timeline_period'])
                     st.plotly_chart(fig, use_container_width=True)
                 
                 # Geographic distribution
-                if 'region' in df.columns and not df['region'].isna().all():
+                if aggs['nonnull'].get('region', 0) > 0:
                     st.subheader("🌍 Geographic Distribution")
-                    geo_data = df.groupby('region').agg({
-                        'amount': 'sum',
-                        'company': 'count'
-                    }).reset_index()
-                    geo_data.columns = ['region', 'total_funding', 'deal_count']
+                    geo_data = aggs['by_region']
                     
-                    fig = px.scatter(
-                        geo_data,
-                        x='deal_count',
-                        y='total_funding',
-                        size='total_funding',
-                        color='total_funding',
-                        hover_data=['region'],
-                        title="Deals vs Funding by Region",
-                        color_continuous_scale=['#A8DADC', '#52796F', '#1B4332'],
-                        size_max=60
-                    )
-                    fig.update_traces(
-                        hovertemplate='<b>%{customdata[0]}</b><br>Deals: %{x}<br>Total Funding: $%{y:,.0f}<extra></extra>',
-                        marker_line_color='#52796F',
-                        marker_line_width=1
-                    )
-                    fig.update_layout(
-                        plot_bgcolor='rgba(241, 250, 238, 0.8)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        xaxis_title="Number of Deals",
-                        yaxis_title="Total Funding (USD)",
-                        xaxis=dict(
-                            gridcolor='rgba(168, 218, 220, 0.5)',
-                            linecolor='#52796F',
-                            tickcolor='#52796F'
-                        ),
-                        yaxis=dict(
-                            gridcolor='rgba(168, 218, 220, 0.5)',
-                            linecolor='#52796F',
-                            tickcolor='#52796F'
-                        ),
-                        font=dict(family="Inter, sans-serif", color='#1B4332'),
-                        title_font_size=16
-                    )
+                    fig = region_scatter_figure(geo_data)
                     st.plotly_chart(fig, use_container_width=True)
             
-            with tab2:
+            if view == DASHBOARD_VIEWS[1]:
                 st.subheader("📋 Funding Events")
                 
+                # Only one page of rows is formatted and sent to the browser
+                page_col1, page_col2 = st.columns(2)
+                with page_col1:
+                    page_size = st.selectbox("Rows per page", DEAL_LIST_PAGE_SIZES, index=1)
+                page_count = max(1, -(-len(df) // page_size))
+                with page_col2:
+                    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+                st.caption(f"Showing page {page} of {page_count} ({len(df)} deals)")
+                
                 # Display data table
-                display_df = df.copy()
+                display_df = df.iloc[(page - 1) * page_size:page * page_size].copy()
                 if 'amount' in display_df.columns:
-                    display_df['amount_formatted'] = display_df['amount'].apply(format_currency)
+                    display_df['amount_formatted'] = format_currency_series(display_df['amount'])
                 if 'date' in display_df.columns:
-                    display_df['date_formatted'] = display_df['date'].apply(format_date)
+                    display_df['date_formatted'] = format_date_series(display_df['date'])
                 
                 # Select columns to display
                 display_columns = [col for col in [
@@ -835,119 +1092,129 @@ def main():
                 else:
                     st.info("No data columns available for display")
             
-            with tab3:
+            if view == DASHBOARD_VIEWS[2]:
                 st.subheader("🤖 AI-Generated Market Intelligence")
-                
-                if st.button("🤖 Generate Insights", type="primary"):
-                    with st.spinner("🌱 Analyzing market trends with AI..."):
-                        try:
-                            insights = ai_processor.generate_market_insights(df)
-                            if insights:
-                                # Create elegant containers for insights
-                                st.markdown("""
-                                <div style="background: linear-gradient(135deg, rgba(168, 218, 220, 0.1) 0%, rgba(241, 250, 238, 0.8) 100%); 
-                                           border-radius: 15px; padding: 20px; margin: 10px 0; border-left: 4px solid #52796F;">
-                                    <h3 style="color: #1B4332; margin-bottom: 15px;">🌱 Key Market Trends</h3>
-                                </div>
-                                """, unsafe_allow_html=True)
-                                st.markdown(insights.get('trends', 'No trends identified'))
-                                
-                                st.markdown("""
-                                <div style="background: linear-gradient(135deg, rgba(168, 218, 220, 0.1) 0%, rgba(241, 250, 238, 0.8) 100%); 
-                                           border-radius: 15px; padding: 20px; margin: 10px 0; border-left: 4px solid #457B9D;">
-                                    <h3 style="color: #1B4332; margin-bottom: 15px;">💡 Investment Opportunities</h3>
-                                </div>
-                                """, unsafe_allow_html=True)
-                                st.markdown(insights.get('opportunities', 'No opportunities identified'))
-                                
-                                st.markdown("""
-                                <div style="background: linear-gradient(135deg, rgba(168, 218, 220, 0.1) 0%, rgba(241, 250, 238, 0.8) 100%); 
-                                           border-radius: 15px; padding: 20px; margin: 10px 0; border-left: 4px solid #8B4513;">
-                                    <h3 style="color: #1B4332; margin-bottom: 15px;">📊 Market Analysis</h3>
-                                </div>
-                                """, unsafe_allow_html=True)
-                                st.markdown(insights.get('analysis', 'No analysis available'))
-                                
-                                # Additional insight sections if available
-                                if insights.get('recommendations'):
-                                    st.markdown("""
-                                    <div style="background: linear-gradient(135deg, rgba(168, 218, 220, 0.1) 0%, rgba(241, 250, 238, 0.8) 100%); 
-                                               border-radius: 15px; padding: 20px; margin: 10px 0; border-left: 4px solid #F4A261;">
-                                        <h3 style="color: #1B4332; margin-bottom: 15px;">🎯 Strategic Recommendations</h3>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                    st.markdown(insights.get('recommendations'))
-                                
-                                if insights.get('risk_factors'):
-                                    st.markdown("""
-                                    <div style="background: linear-gradient(135deg, rgba(168, 218, 220, 0.1) 0%, rgba(241, 250, 238, 0.8) 100%); 
-                                               border-radius: 15px; padding: 20px; margin: 10px 0; border-left: 4px solid #E76F51;">
-                                        <h3 style="color: #1B4332; margin-bottom: 15px;">⚠️ Risk Factors</h3>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                    st.markdown(insights.get('risk_factors'))
-                            else:
-                                st.warning("Unable to generate insights at this time")
-                        except Exception as e:
-                            st.error(f"Error generating insights: {str(e)}")
+                market_insights_panel(df, file_mtime, tuple(filter_key))
             
-            with tab4:
+            if view == DASHBOARD_VIEWS[3]:
                 st.subheader("📈 Market Trends")
                 
                 # Trend analysis
                 if 'date' in df.columns and len(df) > 1:
                     # Monthly trends
-                    df['month'] = df['date'].dt.to_period('M')
-                    monthly_data = df.groupby('month').agg({
-                        'amount': ['sum', 'count', 'mean']
-                    }).reset_index()
-                    monthly_data.columns = ['month', 'total_funding', 'deal_count', 'avg_deal_size']
-                    monthly_data['month'] = monthly_data['month'].astype(str)
+                    monthly_data = aggs['by_month']
                     
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        fig = px.bar(
-                            monthly_data,
-                            x='month',
-                            y='total_funding',
-                            title="Monthly Funding Volume"
-                        )
+                        fig = monthly_volume_figure(monthly_data)
                         st.plotly_chart(fig, use_container_width=True)
                     
                     with col2:
-                        fig = px.line(
-                            monthly_data,
-                            x='month',
-                            y='avg_deal_size',
-                            title="Average Deal Size Trend"
-                        )
+                        fig = avg_deal_size_figure(monthly_data)
                         st.plotly_chart(fig, use_container_width=True)
                     
                     # Sector trends
                     if 'sector' in df.columns:
                         st.subheader("Sector Performance")
-                        sector_trends = df.groupby(['month', 'sector'])['amount'].sum().reset_index()
-                        fig = px.line(
-                            sector_trends,
-                            x='month',
-                            y='amount',
-                            color='sector',
-                            title="Funding Trends by Sector"
-                        )
+                        sector_trends = aggs['by_month_sector']
+                        fig = sector_trends_figure(sector_trends)
                         st.plotly_chart(fig, use_container_width=True)
         
         else:
             st.info("No data matches the current filters.")
     
+    except Exception as e:
+        st.error(f"Error rendering dashboard: {str(e)}")
+
+def main():
+    # The scraper and AI processor are fetched where they are used, so browsing never constructs them
+    data_manager = get_data_manager()
+    
+    # Add floating elements for immersive experience
+    st.markdown("""
+    <div class="floating-element">🌱</div>
+    <div class="floating-element">🍃</div>
+    <div class="floating-element">🌿</div>
+    """, unsafe_allow_html=True)
+    
+    # Enhanced header with focused VC positioning
+    st.markdown('<h1 class="botanical-header">⚡ VC Deal Flow Tracker</h1>', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="glass-container">
+        <p style="margin: 0; font-style: italic; color: var(--sage-green); font-size: 1.1rem;">
+            Precision intelligence for climate tech investors
+        </p>
+        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: var(--soft-gray);">
+            Grid Modernization & Carbon Capture • Seed & Series A • Weekly Deal Reports
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Sidebar
+    with st.sidebar:
+        st.header("Controls")
+        
+        # Enhanced data collection with APITest2 integration
+        st.subheader("⚡ Enhanced Deal Collection")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🔄 Enhanced Scan", type="primary"):
+                with st.spinner("Scanning with enhanced APITest2 integration..."):
+                    try:
+                        # Use enhanced scraper with APITest2 functionality
+                        raw_data = get_scraper().get_funding_articles()
+                        if raw_data:
+                            # Process with focused AI; events go FUNDING_EVENT_PACK_SIZE to a request, packs sent concurrently
+                            processed_data = [
+                                processed_item for processed_item in get_ai_processor().process_funding_events_packed_sync(raw_data)
+                                if processed_item and processed_item.get('is_target_deal', False)
+                            ]
+                            
+                            # Save to storage
+                            if processed_data:
+                                data_manager.save_funding_data(processed_data)
+                                st.success(f"✅ Found {len(processed_data)} new Grid Modernization & Carbon Capture deals")
+                            else:
+                                st.warning("No new target deals found in current scan")
+                        else:
+                            st.warning("No new data found from enhanced sources")
+                    except Exception as e:
+                        st.error(f"Enhanced scan error: {str(e)}")
+        
+        with col2:
+            if st.button("📊 Load VC Deals"):
+                with st.spinner("Loading focused VC deal data..."):
+                    try:
+                        sample_data = create_focused_vc_sample_data()
+                        data_manager.save_funding_data(sample_data)
+                        st.success(f"✅ Loaded {len(sample_data)} Grid Modernization & Carbon Capture deals")
+                    except Exception as e:
+                        st.error(f"Error loading VC deal data: {str(e)}")
+        
+        # Auto-refresh toggle
+        auto_refresh = st.toggle(f"Auto-refresh ({config.AUTO_REFRESH_INTERVAL // 60} min)", value=False)
+        
+    # Load existing data; read after the sidebar actions, so a scan or load shows up in this same run
+    try:
+        file_mtime = funding_file_mtime(data_manager)
+        df = load_typed_funding_data(file_mtime)
+        
+        if df.empty:
+            st.info("📊 No deal data available. Click 'Load VC Deals' to see Grid Modernization & Carbon Capture funding events.")
+            return
+        
+        render_dashboard(df, file_mtime)
+    
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         st.info("Try refreshing the data or check your data sources.")
     
     # Auto-refresh logic
     if auto_refresh:
-        time.sleep(1800)  # 30 minutes
-        st.rerun()
+        st.session_state['last_app_run'] = time.time()
+        auto_refresh_timer()
 
 if __name__ == "__main__":
     main()
@@ -33,6 +33,12 @@ CARBON_KEYWORDS = [
     "carbon storage", "CO2 capture"
 ]
 
+# Funding-announcement indicators; matched as word prefixes ("fund" covers funding/funds/fundraise)
+FUNDING_KEYWORDS = [
+    "raise", "fund", "financing", "series ", "seed", "round", "invest",
+    "backed", "led by", "venture"
+]
+
 # FOCUSED VC USE CASE: Target funding stages only
 TARGET_FUNDING_STAGES = [
     "Seed",
@@ -72,15 +78,49 @@ OPENROUTER_DEFAULT_HEADERS = {
     "X-Title": "Climate Tech Funding Tracker",
 }
 
+# Shared LLM client (see core/openai_client.py)
+OPENAI_TIMEOUT = 60  # Seconds per LLM request
+OPENAI_MAX_RETRIES = 4  # SDK retries with exponential backoff on 429/5xx and connection errors
+
+# Bulk event processing
+FUNDING_EVENT_PACK_SIZE = 20  # Raw events classified per packed (multi-event) extraction request
+
+# LLM response cache (only near-deterministic completions are stored)
+LLM_CACHE_FILE = "llm_cache.sqlite3"
+LLM_CACHE_MAX_TEMPERATURE = 0.1
+
+# Embedding near-match cache for free-text classification (sector, location)
+EMBEDDING_MODEL = "openai/text-embedding-3-small"
+SEMANTIC_CACHE_THRESHOLD = 0.92  # Minimum cosine similarity to reuse a cached result
+
+# Extraction input budget (characters; ~4 chars per token)
+MAX_EXTRACT_CHARS = 2000  # Article body sent to the extraction prompt
+MAX_SUMMARY_CHARS = 500  # Article summary sent to the extraction prompt
+SIGNAL_WINDOW_CHARS = 1500  # Leading text that must mention an amount and a funding term
+
+# Confidence gating for pre-extracted deals (per-field scores, 0-1)
+CONFIDENCE_ACCEPT_THRESHOLD = 0.85  # Every field at or above this skips re-extraction
+SUBSECTOR_CONFIDENCE_ACCEPT = 0.9  # Subsector must also clear this to skip re-extraction
+CONFIDENCE_REJECT_THRESHOLD = 0.5  # Any field below this drops the deal without an LLM call
+
 # Scraping configuration
 SCRAPE_DELAY_MIN = 1  # Minimum delay between requests (seconds)
 SCRAPE_DELAY_MAX = 3  # Maximum delay between requests (seconds)
 REQUEST_TIMEOUT = 10  # HTTP request timeout (seconds)
+HTTP_POOL_SIZE = 20  # Keep-alive connections kept per host
+HTTP_MAX_RETRIES = 3  # Retries for connection errors and 429/5xx responses
+HTTP_BACKOFF_FACTOR = 0.5  # Exponential backoff base between retries (seconds)
+SCRAPE_MAX_CONCURRENCY = 5  # Sources fetched in parallel
+LLM_MAX_CONCURRENCY = 20  # In-flight LLM requests per run
+LLM_RATE_LIMIT = 30  # LLM API requests allowed per LLM_RATE_PERIOD
+LLM_RATE_PERIOD = 60  # Rate limit window (seconds)
 
 # Data processing
 MIN_FUNDING_AMOUNT = 100000  # Minimum funding amount to consider (USD)
 MAX_COMPANY_NAME_LENGTH = 100
 MAX_DESCRIPTION_LENGTH = 500
+# Low-cardinality labels stored as categoricals: groupby, unique and equality work on integer codes
+FUNDING_CATEGORICAL_COLUMNS = ['sector', 'stage', 'region', 'lead_investor', 'company']
 
 # Auto-refresh settings
 AUTO_REFRESH_INTERVAL = 1800  # 30 minutes in seconds
@@ -1,9 +1,226 @@
+import asyncio
+import difflib
 import json
 import os
-from typing import Dict, List, Optional
+import re
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
 import pandas as pd
-from openai import OpenAI
+from core.openai_client import async_openai_client, get_openai_client
 import config
+from utils import AsyncRateLimiter
+from core.llm_cache import cached_chat_completion, cached_chat_completion_async, get_semantic_cache, lookup_cached_completion
+
+# Shared by every extraction call so requests start with an identical, cacheable prefix
+SYSTEM_PROMPT = "You are an expert in climate technology and venture capital. Analyze funding events and classify them accurately."
+
+# Prompt templates: static instructions first, variable slots last
+TARGET_DEAL_CRITERIA = "Target deals only: subsector Grid Modernization (grid infrastructure, transmission, distribution, smart grid, storage integration, grid analytics, demand response) or Carbon Capture (DAC, CCS, carbon utilization, carbon removal); stage Seed or Series A. Otherwise is_target_deal=false."
+
+FUNDING_EVENT_PROMPT = """Classify and extract this funding event; return schema-conformant JSON.
+""" + TARGET_DEAL_CRITERIA + """
+
+Company: {company}
+Amount: {amount}
+Stage: {stage}
+Investor: {lead_investor}
+Description: {description}"""
+
+# Same task for several events in one request; the instructions are paid for once per pack
+PACKED_FUNDING_EVENTS_PROMPT = """Classify and extract each funding event below; return schema-conformant JSON with one entry in results per event, in input order.
+""" + TARGET_DEAL_CRITERIA + """
+
+Events (JSON array of company, amount, stage, lead_investor, description): {events}"""
+
+# Raw event fields the funding event prompts read
+FUNDING_EVENT_FIELDS = ('company', 'amount', 'stage', 'lead_investor', 'description')
+
+SECTOR_PROMPT = """Classify the company description below into specific climate technology sectors.
+
+Available sectors:
+- Solar Energy
+- Wind Energy
+- Energy Storage
+- Carbon Capture & Storage
+- Sustainable Transport & Mobility
+- Agriculture Technology
+- Green Building & Materials
+- Clean Water & Treatment
+- Circular Economy & Waste
+- Climate Adaptation
+- Other Climate Tech
+
+Respond with JSON:
+{{
+    "primary_sector": "main sector",
+    "secondary_sectors": ["list", "of", "additional", "sectors"],
+    "confidence": number between 0 and 1,
+    "reasoning": "brief explanation"
+}}
+
+Description: {description}"""
+
+LOCATION_PROMPT = """Extract location information from the text below and standardize it.
+
+Respond with JSON:
+{{
+    "city": "city name or null",
+    "state_province": "state/province or null",
+    "country": "country name or null",
+    "region": "geographic region (North America, Europe, Asia Pacific, Latin America, Africa, Middle East)",
+    "confidence": number between 0 and 1
+}}
+
+Text: {text}"""
+
+STAGE_PROMPT = """Standardize the funding stage below to one of the standard categories:
+- Pre-Seed
+- Seed
+- Series A
+- Series B
+- Series C
+- Series D+
+- Growth
+- Unknown
+
+Respond with just the standardized category name.
+
+Input: {stage}"""
+
+# Local stage vocabulary as whole-token patterns; "pre-" prefixed text never matches the bare stage
+# Bare "a round" style phrases are left to the LLM: "raised a round" or "public round" are not stages
+# Text naming more than one stage (e.g. "Series A seed extension") is left to the LLM
+_NOT_PRE = r"(?<!pre)(?<!pre[\s-])"
+STAGE_PATTERNS = {
+    "Pre-Seed": r"pre[\s-]?seed",
+    "Seed": _NOT_PRE + r"seed",
+    "Series A": _NOT_PRE + r"series[\s-]?a",
+    "Series B": _NOT_PRE + r"series[\s-]?b",
+    "Series C": _NOT_PRE + r"series[\s-]?c",
+    "Series D+": _NOT_PRE + r"series[\s-]?[d-g]",
+    "Growth": r"growth|late[\s-]stage|pre-ipo",
+}
+_STAGE_REGEXES = [(re.compile(rf"\b(?:{pattern})\b"), stage) for stage, pattern in STAGE_PATTERNS.items()]
+# Near-miss spellings are only accepted for one-word inputs, against stages without a round letter
+STAGE_FUZZY_WORDS = {"preseed": "Pre-Seed", "seed": "Seed", "growth": "Growth"}
+STAGE_FUZZY_CUTOFF = 0.85  # difflib ratio needed to accept a near-miss spelling
+
+# Grouping columns summarized for market insights -> summary key
+SUMMARY_COUNT_COLUMNS = {
+    'sector': 'sectors',
+    'stage': 'stages',
+    'region': 'regions',
+    'lead_investor': 'top_investors'
+}
+
+_NULLABLE_SCORE = {"type": ["number", "null"]}
+
+# Strict structured-output schema for process_funding_event; replaces the JSON template in the prompt
+FUNDING_EVENT_SCHEMA = {
+    "name": "funding_event",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "is_target_deal": {"type": "boolean"},
+            "startup_name": {"type": ["string", "null"]},
+            "subsector": {"type": ["string", "null"], "enum": ["Grid Modernization", "Carbon Capture", None]},
+            "funding_stage": {"type": ["string", "null"], "enum": ["Seed", "Series A", None]},
+            "amount_raised": {"type": ["number", "null"], "description": "USD millions"},
+            "lead_investor": {"type": ["string", "null"]},
+            "region": {"type": ["string", "null"]},
+            "date": {"type": ["string", "null"], "description": "YYYY-MM-DD"},
+            "confidence_scores": {
+                "type": "object",
+                "properties": {
+                    "startup_name": _NULLABLE_SCORE,
+                    "subsector": _NULLABLE_SCORE,
+                    "funding_stage": _NULLABLE_SCORE,
+                    "amount_raised": _NULLABLE_SCORE,
+                    "lead_investor": _NULLABLE_SCORE
+                },
+                "required": ["startup_name", "subsector", "funding_stage", "amount_raised", "lead_investor"],
+                "additionalProperties": False
+            }
+        },
+        "required": [
+            "is_target_deal", "startup_name", "subsector", "funding_stage", "amount_raised",
+            "lead_investor", "region", "date", "confidence_scores"
+        ],
+        "additionalProperties": False
+    }
+}
+
+# Packed variant: one schema-conformant result per input event
+FUNDING_EVENTS_SCHEMA = {
+    "name": "funding_events",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {"type": "array", "items": FUNDING_EVENT_SCHEMA["schema"]}
+        },
+        "required": ["results"],
+        "additionalProperties": False
+    }
+}
+
+# Compact JSON for prompts: no whitespace means fewer bytes and fewer prompt tokens
+COMPACT_SEPARATORS = (',', ':')
+
+def _json_default(obj):
+    """Serialize numpy/pandas scalars (and anything else) found in summary data"""
+    return obj.item() if hasattr(obj, 'item') else str(obj)
+
+class _TopLevelJSONStream:
+    """
+    Incremental parser for a streamed JSON object
+    Emits each top-level key/value pair once the value is complete
+    """
+    
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = None  # Index after the opening brace once seen
+    
+    def _skip(self, chars: str):
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in chars:
+            self._pos += 1
+    
+    def feed(self, text: str) -> Iterator[Tuple[str, object]]:
+        self._buffer += text
+        if self._pos is None:
+            start = self._buffer.find('{')
+            if start == -1:
+                return
+            self._pos = start + 1
+        
+        while True:
+            self._skip(' \t\r\n,')
+            try:
+                key, end = self._decoder.raw_decode(self._buffer, self._pos)
+                colon = self._buffer.index(':', end)
+                value_start = colon + 1
+                while value_start < len(self._buffer) and self._buffer[value_start] in ' \t\r\n':
+                    value_start += 1
+                value, end = self._decoder.raw_decode(self._buffer, value_start)
+            except ValueError:
+                return  # Incomplete pair; wait for more text
+            # A value is only complete once the pair's ',' or the closing '}' follows it:
+            # "3" decodes before ".5" arrives, and "tru" never does
+            after = end
+            while after < len(self._buffer) and self._buffer[after] in ' \t\r\n':
+                after += 1
+            if after >= len(self._buffer) or self._buffer[after] not in ',}':
+                return
+            self._pos = end
+            yield key, value
+    
+    def close(self) -> Iterator[Tuple[str, object]]:
+        """Flush a final pair of a stream that ended without its closing brace"""
+        if self._pos is None:
+            return
+        yield from self.feed("}")
 
 class AIProcessor:
     """AI-powered processing of funding data using OpenAI"""
@@ -12,129 +229,208 @@ class AIProcessor:
         # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
         # do not change this unless explicitly requested by the user
         self.model = "gpt-4o"
-        self.client = OpenAI(
-            api_key=config.OPENAI_API_KEY,
-            base_url=config.OPENROUTER_BASE_URL,
-            default_headers=config.OPENROUTER_DEFAULT_HEADERS,
-        )
+        # High-volume classification/extraction runs on the smaller model; insights keep gpt-4o
+        self.extraction_model = "openai/gpt-4o-mini"
+        self.client = get_openai_client(config.OPENAI_API_KEY)
+        
+        # Near-match caches for free-text inputs that vary only superficially
+        self._sector_cache = get_semantic_cache("sector")
+        self._location_cache = get_semantic_cache("location")
         
     def process_funding_event(self, raw_data: Dict) -> Optional[Dict]:
         """Process and classify funding events for focused VC deal flow tracking"""
         try:
-            prompt = f"""
-            You are an expert data extraction agent focused on climate tech funding events for VC deal flow tracking.
-            
-            CRITICAL FOCUS: Only extract deals that match ALL criteria:
-            1. Subsector: Must be exactly "Grid Modernization" OR "Carbon Capture" 
-            2. Funding Stage: Must be exactly "Seed" OR "Series A"
-            3. Must have clear funding information
-            
-            Grid Modernization includes: grid infrastructure, transmission, distribution, smart grid, energy storage integration, grid analytics, demand response
-            Carbon Capture includes: direct air capture, carbon capture and storage (CCS), carbon utilization, carbon removal technologies
-            
-            Raw funding data:
-            Company: {raw_data.get('company', 'Unknown')}
-            Amount: {raw_data.get('amount', 'Unknown')}
-            Stage: {raw_data.get('stage', 'Unknown')}
-            Investor: {raw_data.get('lead_investor', 'Unknown')}
-            Description: {raw_data.get('description', 'Unknown')}
-            
-            Extract ONLY these 5 essential fields:
-            1. startup_name: Company receiving funding
-            2. subsector: "Grid Modernization" or "Carbon Capture" (exact match required)
-            3. funding_stage: "Seed" or "Series A" (exact match required)
-            4. amount_raised: USD amount in millions
-            5. lead_investor: Primary/lead investor (HIGHEST PRIORITY - VC firms track competitors)
-            
-            IGNORE any funding stages other than Seed or Series A.
-            
-            Respond with JSON in this exact format:
-            {{
-                "is_target_deal": boolean,
-                "startup_name": "string or null",
-                "subsector": "Grid Modernization" or "Carbon Capture" or null,
-                "funding_stage": "Seed" or "Series A" or null,
-                "amount_raised": number in millions USD or null,
-                "lead_investor": "string or null",
-                "region": "geographic region or null", 
-                "date": "funding date in YYYY-MM-DD format or null",
-                "confidence_scores": {{
-                    "startup_name": number (0-1),
-                    "subsector": number (0-1), 
-                    "funding_stage": number (0-1),
-                    "amount_raised": number (0-1),
-                    "lead_investor": number (0-1)
-                }}
-            }}
-            
-            If no qualifying deal found, return {{"is_target_deal": false}}.
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in climate technology and venture capital. Analyze funding events and classify them accurately."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1
+            request = self._funding_event_request(raw_data)
+            content = self._cached_chat(
+                request['messages'],
+                temperature=request['temperature'],
+                response_format=request['response_format'],
+                model=request['model']
             )
-            
-            result = json.loads(response.choices[0].message.content or "{}")
-            
-            # Add metadata
-            result['processed_date'] = pd.Timestamp.now().isoformat()
-            result['source'] = raw_data.get('source', 'Unknown')
-            result['ai_processed'] = True
-            
-            return result
+            result = json.loads(content or "{}")
+            return self._finalize_funding_event(result, raw_data)
             
         except Exception as e:
             print(f"Error processing funding event: {str(e)}")
             return None
     
+    async def process_funding_events(self, raw_events: List[Dict],
+                                     concurrency: int = config.LLM_MAX_CONCURRENCY,
+                                     limiter: Optional[AsyncRateLimiter] = None) -> List[Optional[Dict]]:
+        """
+        Process many funding events concurrently for interactive use
+        Results keep input order; failed events come back as None
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = limiter or AsyncRateLimiter(config.LLM_RATE_LIMIT, config.LLM_RATE_PERIOD)
+        
+        # Async client is bound to this event loop, so it lives for one run only
+        async with async_openai_client(config.OPENAI_API_KEY) as client:
+            async def process_one(raw_data: Dict) -> Optional[Dict]:
+                request = self._funding_event_request(raw_data)
+                content = await cached_chat_completion_async(
+                    client, request['model'], request['messages'],
+                    temperature=request['temperature'],
+                    response_format=request['response_format'],
+                    semaphore=semaphore,
+                    limiter=limiter
+                )
+                return self._finalize_funding_event(json.loads(content or "{}"), raw_data)
+            
+            results = await asyncio.gather(*[process_one(raw) for raw in raw_events], return_exceptions=True)
+        
+        processed = []
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error processing funding event: {str(result)}")
+                processed.append(None)
+            else:
+                processed.append(result)
+        
+        return processed
+    
+    def process_funding_events_sync(self, raw_events: List[Dict]) -> List[Optional[Dict]]:
+        """Blocking wrapper around process_funding_events"""
+        if not raw_events:
+            return []
+        return asyncio.run(self.process_funding_events(raw_events))
+    
+    async def process_funding_events_packed(self, raw_events: List[Dict],
+                                            pack_size: int = config.FUNDING_EVENT_PACK_SIZE,
+                                            concurrency: int = config.LLM_MAX_CONCURRENCY) -> List[Optional[Dict]]:
+        """
+        Process funding events pack_size at a time, one request per pack, packs running concurrently
+        Results keep input order; a pack whose reply does not line up is retried one event per request
+        """
+        packs = [raw_events[i:i + pack_size] for i in range(0, len(raw_events), pack_size)]
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = AsyncRateLimiter(config.LLM_RATE_LIMIT, config.LLM_RATE_PERIOD)
+        
+        # Async client is bound to this event loop, so it lives for one run only
+        async with async_openai_client(config.OPENAI_API_KEY) as client:
+            async def process_pack(pack: List[Dict]) -> List[Optional[Dict]]:
+                request = self._packed_funding_events_request(pack)
+                content = await cached_chat_completion_async(
+                    client, request['model'], request['messages'],
+                    temperature=request['temperature'],
+                    response_format=request['response_format'],
+                    semaphore=semaphore,
+                    limiter=limiter
+                )
+                results = json.loads(content or "{}").get('results')
+                if not isinstance(results, list) or len(results) != len(pack):
+                    raise ValueError(f"expected {len(pack)} results, got {len(results) if isinstance(results, list) else 'none'}")
+                return [self._finalize_funding_event(result, raw_data) for result, raw_data in zip(results, pack)]
+            
+            pack_results = await asyncio.gather(*[process_pack(pack) for pack in packs], return_exceptions=True)
+        
+        processed = []
+        for pack, result in zip(packs, pack_results):
+            if isinstance(result, Exception):
+                print(f"Error processing funding event pack, retrying per event: {str(result)}")
+                result = await self.process_funding_events(pack, concurrency, limiter)
+            processed.extend(result)
+        
+        return processed
+    
+    def process_funding_events_packed_sync(self, raw_events: List[Dict]) -> List[Optional[Dict]]:
+        """Blocking wrapper around process_funding_events_packed"""
+        if not raw_events:
+            return []
+        return asyncio.run(self.process_funding_events_packed(raw_events))
+    
+    def _cached_chat(self, messages: List[Dict], temperature: float,
+                     response_format: Optional[Dict] = None, max_tokens: Optional[int] = None,
+                     model: Optional[str] = None) -> str:
+        """Chat completion (default: this processor's model), answered from the on-disk cache when possible"""
+        return cached_chat_completion(
+            self.client, model or self.model, messages, temperature,
+            response_format=response_format, max_tokens=max_tokens
+        )
+    
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Embed text for semantic cache lookups; None if the embedding call fails"""
+        try:
+            response = self.client.embeddings.create(model=config.EMBEDDING_MODEL, input=text)
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Error embedding text: {str(e)}")
+            return None
+    
+    def _funding_event_request(self, raw_data: Dict) -> Dict:
+        """Build the chat completion request body for a single raw funding event"""
+        prompt = FUNDING_EVENT_PROMPT.format_map(defaultdict(lambda: 'Unknown', raw_data))
+        
+        return {
+            "model": self.extraction_model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": {"type": "json_schema", "json_schema": FUNDING_EVENT_SCHEMA},
+            "temperature": 0.1
+        }
+    
+    def _packed_funding_events_request(self, raw_events: List[Dict]) -> Dict:
+        """Build one chat completion request body covering several raw funding events"""
+        events = [{field: raw_data.get(field, 'Unknown') for field in FUNDING_EVENT_FIELDS} for raw_data in raw_events]
+        prompt = PACKED_FUNDING_EVENTS_PROMPT.format(
+            events=json.dumps(events, separators=COMPACT_SEPARATORS, default=_json_default)
+        )
+        
+        return {
+            "model": self.extraction_model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": {"type": "json_schema", "json_schema": FUNDING_EVENTS_SCHEMA},
+            "temperature": 0.1
+        }
+    
+    def _finalize_funding_event(self, result: Dict, raw_data: Dict) -> Dict:
+        """Attach processing metadata to a parsed model response"""
+        result['processed_date'] = pd.Timestamp.now().isoformat()
+        result['source'] = raw_data.get('source', 'Unknown')
+        result['ai_processed'] = True
+        
+        return result
+    
+    def _classify_with_caches(self, semantic_cache, text: str, prompt: str) -> Dict:
+        """
+        JSON classification of text: exact response cache, then an embedding near-match, then the LLM
+        The embedding round trip is only paid when this exact request has not been answered before
+        """
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+        options = {"temperature": 0.1, "response_format": {"type": "json_object"}}
+        
+        cached = lookup_cached_completion(self.extraction_model, messages, **options)
+        if cached is not None:
+            return json.loads(cached)
+        
+        vector = self._embed(text)
+        if vector is not None:
+            near_match = semantic_cache.lookup(vector)
+            if near_match is not None:
+                return near_match
+        
+        content = self._cached_chat(messages, model=self.extraction_model, **options)
+        result = json.loads(content or "{}")
+        if vector is not None and result:
+            semantic_cache.add(vector, result)
+        
+        return result
+    
     def classify_climate_sector(self, company_description: str) -> Dict:
         """Classify a company into specific climate tech sectors"""
         try:
-            prompt = f"""
-            Classify the following company description into specific climate technology sectors.
-            
-            Description: {company_description}
-            
-            Available sectors:
-            - Solar Energy
-            - Wind Energy
-            - Energy Storage
-            - Carbon Capture & Storage
-            - Sustainable Transport & Mobility
-            - Agriculture Technology
-            - Green Building & Materials
-            - Clean Water & Treatment
-            - Circular Economy & Waste
-            - Climate Adaptation
-            - Other Climate Tech
-            
-            Respond with JSON:
-            {{
-                "primary_sector": "main sector",
-                "secondary_sectors": ["list", "of", "additional", "sectors"],
-                "confidence": number between 0 and 1,
-                "reasoning": "brief explanation"
-            }}
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in climate technology categorization."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1
+            return self._classify_with_caches(
+                self._sector_cache, company_description, SECTOR_PROMPT.format(description=company_description)
             )
             
-            return json.loads(response.choices[0].message.content or "{}")
-            
         except Exception as e:
             print(f"Error classifying climate sector: {str(e)}")
             return {"primary_sector": "Other Climate Tech", "confidence": 0.0}
@@ -142,32 +438,7 @@ class AIProcessor:
     def extract_location_info(self, text: str) -> Dict:
         """Extract and standardize location information"""
         try:
-            prompt = f"""
-            Extract location information from the following text and standardize it.
-            
-            Text: {text}
-            
-            Respond with JSON:
-            {{
-                "city": "city name or null",
-                "state_province": "state/province or null", 
-                "country": "country name or null",
-                "region": "geographic region (North America, Europe, Asia Pacific, Latin America, Africa, Middle East)",
-                "confidence": number between 0 and 1
-            }}
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in geographic data extraction and standardization."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1
-            )
-            
-            return json.loads(response.choices[0].message.content or "{}")
+            return self._classify_with_caches(self._location_cache, text, LOCATION_PROMPT.format(text=text))
             
         except Exception as e:
             print(f"Error extracting location: {str(e)}")
@@ -176,88 +447,108 @@ class AIProcessor:
     def generate_market_insights(self, df: pd.DataFrame) -> Optional[Dict]:
         """Generate AI-powered market insights from funding data"""
         try:
-            # Prepare data summary for AI analysis with proper JSON serialization
-            summary_data = {
-                "total_deals": int(len(df)),
-                "total_funding": float(df['amount'].sum()) if 'amount' in df.columns else 0.0,
-                "avg_deal_size": float(df['amount'].mean()) if 'amount' in df.columns else 0.0,
-                "sectors": {str(k): int(v) for k, v in df['sector'].value_counts().to_dict().items()} if 'sector' in df.columns else {},
-                "stages": {str(k): int(v) for k, v in df['stage'].value_counts().to_dict().items()} if 'stage' in df.columns else {},
-                "regions": {str(k): int(v) for k, v in df['region'].value_counts().to_dict().items()} if 'region' in df.columns else {},
-                "top_investors": {str(k): int(v) for k, v in df['lead_investor'].value_counts().head(10).to_dict().items()} if 'lead_investor' in df.columns else {}
-            }
-            
-            prompt = f"""
-            Analyze the following climate tech funding data and provide market insights.
-            
-            Data Summary:
-            {json.dumps(summary_data, indent=2)}
-            
-            Provide analysis in the following areas:
-            1. Key market trends and patterns
-            2. Investment opportunities and gaps
-            3. Geographic distribution insights
-            4. Sector performance analysis
-            5. Stage distribution patterns
-            
-            Respond with JSON:
-            {{
-                "trends": "markdown-formatted analysis of key trends",
-                "opportunities": "markdown-formatted investment opportunities",
-                "analysis": "markdown-formatted detailed market analysis",
-                "recommendations": "markdown-formatted recommendations",
-                "risk_factors": "markdown-formatted potential risks"
-            }}
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a senior climate tech venture capital analyst with deep market expertise."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3
-            )
-            
-            return json.loads(response.choices[0].message.content or "{}")
+            return dict(self.stream_market_insights(df))
             
         except Exception as e:
             print(f"Error generating market insights: {str(e)}")
             return None
     
+    def stream_market_insights(self, df: pd.DataFrame) -> Iterator[Tuple[str, str]]:
+        """
+        Stream market insights as (section, markdown) pairs
+        Each top-level key is yielded as soon as its value has been generated
+        """
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._market_insights_messages(df),
+            temperature=0.3,
+            response_format={"type": "json_object"},
+            stream=True
+        )
+        
+        parser = _TopLevelJSONStream()
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield from parser.feed(chunk.choices[0].delta.content)
+        yield from parser.close()
+    
+    def _market_insights_messages(self, df: pd.DataFrame) -> List[Dict]:
+        """Summarize funding data into the market insights chat messages"""
+        # Prepare data summary for AI analysis; numpy scalars are converted at serialization time
+        amount_stats = df['amount'].astype('float64').agg(['sum', 'mean']) if 'amount' in df.columns else {'sum': 0.0, 'mean': 0.0}
+        summary_data = {
+            "total_deals": len(df),
+            "total_funding": amount_stats['sum'],
+            "avg_deal_size": amount_stats['mean']
+        }
+        
+        # One counts pass per grouping column; categorical columns report unused categories as 0, so drop those
+        for column, key in SUMMARY_COUNT_COLUMNS.items():
+            counts = df[column].value_counts().head(10) if column in df.columns else pd.Series(dtype='int64')
+            summary_data[key] = counts[counts > 0].to_dict()
+        
+        prompt = f"""
+        Analyze the following climate tech funding data and provide market insights.
+        
+        Data Summary:
+        {json.dumps(summary_data, separators=COMPACT_SEPARATORS, default=_json_default)}
+        
+        Provide analysis in the following areas:
+        1. Key market trends and patterns
+        2. Investment opportunities and gaps
+        3. Geographic distribution insights
+        4. Sector performance analysis
+        5. Stage distribution patterns
+        
+        Respond with JSON:
+        {{
+            "trends": "markdown-formatted analysis of key trends",
+            "opportunities": "markdown-formatted investment opportunities",
+            "analysis": "markdown-formatted detailed market analysis",
+            "recommendations": "markdown-formatted recommendations",
+            "risk_factors": "markdown-formatted potential risks"
+        }}
+        """
+        
+        return [
+            {"role": "system", "content": "You are a senior climate tech venture capital analyst with deep market expertise."},
+            {"role": "user", "content": prompt}
+        ]
+    
     def standardize_funding_stage(self, stage_text: str) -> str:
         """Standardize funding stage nomenclature"""
+        stage = self._match_stage_locally(stage_text)
+        if stage:
+            return stage
+        
         try:
-            prompt = f"""
-            Standardize the following funding stage to one of the standard categories:
+            prompt = STAGE_PROMPT.format(stage=stage_text)
             
-            Input: {stage_text}
-            
-            Standard categories:
-            - Pre-Seed
-            - Seed
-            - Series A
-            - Series B
-            - Series C
-            - Series D+
-            - Growth
-            - Unknown
-            
-            Respond with just the standardized category name.
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in venture capital funding terminology."},
+            content = self._cached_chat(
+                [
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.1
+                temperature=0.1,
+                model=self.extraction_model
             )
             
-            return (response.choices[0].message.content or "Unknown").strip()
+            return (content or "Unknown").strip()
             
         except Exception as e:
             print(f"Error standardizing stage: {str(e)}")
             return "Unknown"
+    
+    def _match_stage_locally(self, stage_text: str) -> Optional[str]:
+        """Resolve common stage spellings without an API call; None when unsure"""
+        text = str(stage_text or "").strip().lower()
+        if not text:
+            return "Unknown"
+        
+        matches = {stage for pattern, stage in _STAGE_REGEXES if pattern.search(text)}
+        if len(matches) == 1:
+            return matches.pop()
+        if matches or len(text.split()) > 1:
+            return None
+        close = difflib.get_close_matches(text, list(STAGE_FUZZY_WORDS), n=1, cutoff=STAGE_FUZZY_CUTOFF)
+        return STAGE_FUZZY_WORDS[close[0]] if close else None
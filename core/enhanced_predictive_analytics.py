@@ -8,7 +8,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import json
-from openai import OpenAI
+from core.openai_client import get_openai_client
 from sklearn.linear_model import LinearRegression, Ridge
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.preprocessing import PolynomialFeatures, StandardScaler
@@ -30,11 +30,7 @@ class EnhancedPredictiveAnalytics:
     
     def __init__(self):
         # AI model configuration
-        self.client = OpenAI(
-            api_key=config.OPENAI2_API_KEY,
-            base_url=config.OPENROUTER_BASE_URL,
-            default_headers=config.OPENROUTER_DEFAULT_HEADERS,
-        )
+        self.client = get_openai_client(config.OPENAI2_API_KEY)
         
         # Enhanced model ensemble
         self.models = {
@@ -5,10 +5,51 @@ Converts raw news articles into structured VC deal data
 
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import config
 from typing import Dict, Optional, List
-from openai import OpenAI
+from core.openai_client import get_openai_client
 from core.funding_event import FundingEvent, FundingEventValidator
+from core.llm_cache import cached_chat_completion
+from utils import RateLimiter
+
+# Dollar/euro/pound figure or an amount with a million/billion unit
+AMOUNT_PATTERN = re.compile(r'[$€£]\s?\d|\b\d+(?:\.\d+)?\s?(?:m|mn|million|b|bn|billion)\b', re.IGNORECASE)
+
+# Per-field confidence columns of pre-extracted deals, in matrix column order
+CONFIDENCE_FIELDS = ['startup_name', 'subsector', 'funding_stage', 'amount_raised', 'lead_investor']
+
+def _confidence_row(record: Dict) -> List[float]:
+    """One record's scores in CONFIDENCE_FIELDS order; missing or non-numeric scores become NaN"""
+    confidence_scores = record.get('confidence_scores')
+    if not isinstance(confidence_scores, dict):
+        return [np.nan] * len(CONFIDENCE_FIELDS)
+    
+    row = []
+    for field in CONFIDENCE_FIELDS:
+        try:
+            row.append(float(confidence_scores[field]))
+        except (KeyError, TypeError, ValueError):
+            row.append(np.nan)
+    return row
+
+def confidence_tiers(records: List[Dict]) -> np.ndarray:
+    """
+    Bucket pre-extracted deals by their per-field confidence scores in one vectorized pass
+    Returns an array of 'accept', 'reject' or 'ambiguous' (worth a fresh extraction)
+    A malformed score only makes its own record ambiguous rather than failing the batch
+    """
+    scores = np.array([_confidence_row(record) for record in records],
+                      dtype=np.float32).reshape(len(records), len(CONFIDENCE_FIELDS))
+    
+    # Any scored field below the floor rejects; NaN (missing) compares False, so it never rejects
+    reject = np.any(scores < config.CONFIDENCE_REJECT_THRESHOLD, axis=1)
+    # Accepting needs every field scored and at or above the threshold, so a missing score means ambiguous
+    accept = (np.all(scores >= config.CONFIDENCE_ACCEPT_THRESHOLD, axis=1) &
+              (scores[:, CONFIDENCE_FIELDS.index('subsector')] >= config.SUBSECTOR_CONFIDENCE_ACCEPT))
+    return np.where(reject, 'reject', np.where(accept, 'accept', 'ambiguous'))
 
 class FundingDataExtractor:
     """
@@ -21,27 +62,36 @@ class FundingDataExtractor:
         # do not change this unless explicitly requested by the user
         self.model = "openai/gpt-4o"  # OpenRouter format for model
         # OpenRouter API setup using OPENAI2 secret for CTVC scraping
-        self.client = OpenAI(
-            api_key=config.OPENAI2_API_KEY,
-            base_url=config.OPENROUTER_BASE_URL,
-            default_headers=config.OPENROUTER_DEFAULT_HEADERS,
-        )
+        self.client = get_openai_client(config.OPENAI2_API_KEY)
+        # Shared by the batch worker threads so concurrent extraction stays under the API rate
+        self.rate_limiter = RateLimiter(config.LLM_RATE_LIMIT, config.LLM_RATE_PERIOD)
+        
+        # VC investment criteria
+        self.target_subsectors = config.TARGET_SUBSECTORS
+        self.target_stages = config.TARGET_FUNDING_STAGES
     
-    def extract_funding_event(self, raw_content: Dict) -> Optional[FundingEvent]:
+    def extract_funding_event(self, raw_content: Dict, tier: Optional[str] = None) -> Optional[FundingEvent]:
         """
         Extract structured funding event from raw article content
         Returns FundingEvent if valid VC deal, None otherwise
         """
         try:
             # Handle different input formats
-            if isinstance(raw_content, dict) and 'is_target_deal' in raw_content:
-                # Already processed by enhanced API client
-                return self._format_enhanced_data(raw_content)
+            pre_extracted = isinstance(raw_content, dict) and 'is_target_deal' in raw_content
+            if pre_extracted:
+                # Already processed by enhanced API client; only re-extract when its confidence is ambiguous
+                if tier is None:
+                    tier = confidence_tiers([raw_content])[0]
+                if tier == 'reject':
+                    return None
+                if tier == 'accept' or not self._prepare_content_for_extraction(raw_content):
+                    return self._format_enhanced_data(raw_content)
             
             # Extract structured data using AI
             extracted_data = self._ai_extract_deal_data(raw_content)
             if not extracted_data:
-                return None
+                # A fresh extraction that finds nothing leaves a pre-extracted deal as it was
+                return self._format_enhanced_data(raw_content) if pre_extracted else None
             
             # Create funding event
             event = FundingEvent(
@@ -60,6 +110,8 @@ class FundingDataExtractor:
             # Validate event meets VC criteria  
             if event.is_valid_vc_deal():
                 return event
+            elif pre_extracted:
+                return self._format_enhanced_data(raw_content)
             else:
                 return None
                 
@@ -71,6 +123,8 @@ class FundingDataExtractor:
         """Use AI to extract structured deal data from raw content"""
         
         content_text = self._prepare_content_for_extraction(raw_content)
+        if not self._has_funding_signal(content_text):
+            return None
         
         prompt = f"""You are a VC funding analyst extracting deal data for climate tech investments.
 
@@ -103,14 +157,15 @@ Return JSON:
 }}"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            content = cached_chat_completion(
+                self.client, self.model,
+                [{"role": "user", "content": prompt}],
+                temperature=0.1,
                 response_format={"type": "json_object"},
-                temperature=0.1
+                limiter=self.rate_limiter
             )
             
-            extracted_data = json.loads(response.choices[0].message.content)
+            extracted_data = json.loads(content)
             
             # Validate target deal criteria
             if (extracted_data.get('subsector') in self.target_subsectors and 
@@ -126,6 +181,11 @@ Return JSON:
             print(f"AI extraction error: {e}")
             return None
     
+    def _has_funding_signal(self, content_text: str) -> bool:
+        """Cheap precheck: announcements state an amount and a funding term near the top"""
+        window = content_text[:config.SIGNAL_WINDOW_CHARS]
+        return bool(AMOUNT_PATTERN.search(window) and ArticleClassifier.FUNDING_PATTERN.search(window))
+    
     def _prepare_content_for_extraction(self, raw_content: Dict) -> str:
         """Prepare raw content for AI extraction"""
         content_parts = []
@@ -134,12 +194,12 @@ Return JSON:
             content_parts.append(f"Title: {raw_content['title']}")
         
         if raw_content.get('content'):
-            # Limit content length for AI processing
-            content = raw_content['content'][:2000]
+            # Funding announcements lead with the deal; the tail only adds prompt tokens
+            content = raw_content['content'][:config.MAX_EXTRACT_CHARS]
             content_parts.append(f"Content: {content}")
         
         if raw_content.get('summary'):
-            content_parts.append(f"Summary: {raw_content['summary']}")
+            content_parts.append(f"Summary: {raw_content['summary'][:config.MAX_SUMMARY_CHARS]}")
         
         return '\n\n'.join(content_parts)
     
@@ -168,10 +228,17 @@ Return JSON:
         """Extract funding events from multiple raw content items"""
         events = []
         
-        for raw_content in raw_content_list:
-            event = self.extract_funding_event(raw_content)
-            if event:
-                events.append(event)
+        # Score every pre-extracted record at once instead of branching per record
+        pre_extracted = [i for i, raw in enumerate(raw_content_list) if isinstance(raw, dict) and 'is_target_deal' in raw]
+        tiers = dict(zip(pre_extracted, confidence_tiers([raw_content_list[i] for i in pre_extracted])))
+        pending = [(raw_content, tiers.get(index)) for index, raw_content in enumerate(raw_content_list)
+                   if tiers.get(index) != 'reject']
+        
+        # Extraction waits on one LLM round trip per item, so items run concurrently; map keeps input order
+        with ThreadPoolExecutor(max_workers=config.LLM_MAX_CONCURRENCY) as executor:
+            for event in executor.map(lambda item: self.extract_funding_event(*item), pending):
+                if event:
+                    events.append(event)
         
         return events
     
@@ -209,22 +276,27 @@ Return JSON:
 class ArticleClassifier:
     """Classify articles as funding announcements vs general news"""
     
+    # Single compiled alternation; articles with no funding vocabulary never reach the LLM
+    FUNDING_PATTERN = re.compile(
+        r'\b(?:' + '|'.join(re.escape(keyword) for keyword in config.FUNDING_KEYWORDS) + ')',
+        re.IGNORECASE
+    )
+    
     def __init__(self):
         # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
         # do not change this unless explicitly requested by the user
         self.model = "gpt-4o" # Keep the model here
         # --- NEW: Use config for client setup ---
-        self.client = OpenAI(
-            api_key=config.OPENAI_API_KEY,
-            base_url=config.OPENROUTER_BASE_URL,
-            default_headers=config.OPENROUTER_DEFAULT_HEADERS,
-        )
+        self.client = get_openai_client(config.OPENAI_API_KEY)
     
     def classify_article(self, title: str, content: str) -> str:
         """
         Classify article type for funding event detection
         Returns: 'STARTUP_FUNDING_ROUND', 'FUND_ANNOUNCEMENT', 'GENERAL_NEWS'
         """
+        if not self.FUNDING_PATTERN.search(f"{title} {content[:2000]}"):
+            return "GENERAL_NEWS"
+        
         prompt = f"""You are a funding news classifier. Classify this article into one category.
 
 Categories:
@@ -240,14 +312,14 @@ Content: "{content[:500]}"
 Respond with only the category name:"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            content = cached_chat_completion(
+                self.client, self.model,
+                [{"role": "user", "content": prompt}],
                 temperature=0,
                 max_tokens=50
             )
             
-            classification = response.choices[0].message.content.strip()
+            classification = content.strip()
             
             valid_categories = ["STARTUP_FUNDING_ROUND", "FUND_ANNOUNCEMENT", "GENERAL_NEWS"]
             if not any(cat in classification for cat in valid_categories):
@@ -162,7 +162,8 @@ class FundingEventCollection:
     
     def filter_by_investor(self, investor: str) -> 'FundingEventCollection':
         """Filter events by lead investor"""
-        filtered = [e for e in self.events if investor.lower() in e.lead_investor.lower()]
+        needle = investor.lower()
+        filtered = [e for e in self.events if needle in e.lead_investor.lower()]
         return FundingEventCollection(filtered)
     
     def get_total_funding(self) -> float:
@@ -7,7 +7,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
 import json
-from openai import OpenAI
+from core.openai_client import get_openai_client
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics.pairwise import cosine_similarity
@@ -25,11 +25,7 @@ class InvestorIntelligence:
     
     def __init__(self):
         # AI client for market analysis
-        self.client = OpenAI(
-            api_key=config.OPENAI2_API_KEY,
-            base_url=config.OPENROUTER_BASE_URL,
-            default_headers=config.OPENROUTER_DEFAULT_HEADERS,
-        )
+        self.client = get_openai_client(config.OPENAI2_API_KEY)
         
         # Analysis parameters
         self.target_sectors = config.TARGET_SUBSECTORS
@@ -0,0 +1,228 @@
+"""
+On-disk cache for deterministic LLM completions
+Identical low-temperature requests are answered from SQLite instead of the API
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+import config
+
+class LLMResponseCache:
+    """
+    SQLite-backed store of completion text keyed by a SHA-256 of the request
+    Shared across threads so Streamlit sessions reuse each other's answers
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or os.path.join(config.DATA_DIRECTORY, config.LLM_CACHE_FILE)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(**request) -> str:
+        """Hash the full request so any change to model, prompt or options misses the cache"""
+        payload = json.dumps(request, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached completion text or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str):
+        """Store completion text for a request key"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions (key, content) VALUES (?, ?)", (key, content)
+            )
+            self._conn.commit()
+
+class SemanticCache:
+    """
+    Near-duplicate lookup of LLM results by embedding similarity
+    Keeps an L2-normalized float32 matrix of past inputs in memory; each entry is also
+    appended as one SQLite row, so adding is a single insert rather than a rewrite of the cache
+    """
+
+    def __init__(self, name: str, threshold: float = None, path: str = None):
+        self.name = name
+        self.threshold = config.SEMANTIC_CACHE_THRESHOLD if threshold is None else threshold
+        self.path = path or os.path.join(config.DATA_DIRECTORY, config.LLM_CACHE_FILE)
+        self._lock = threading.Lock()
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._payloads: List[Dict] = []
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_entries (name TEXT NOT NULL, vector BLOB NOT NULL, payload TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._load()
+
+    def _load(self):
+        """Restore the vectors and payloads saved by previous runs"""
+        try:
+            rows = self._conn.execute(
+                "SELECT vector, payload FROM semantic_entries WHERE name = ? ORDER BY rowid", (self.name,)
+            ).fetchall()
+            vectors = [np.frombuffer(vector, dtype=np.float32) for vector, _ in rows]
+            # Only entries from the latest embedding dimensions are comparable with new queries
+            keep = [i for i, vector in enumerate(vectors) if vector.shape == vectors[-1].shape]
+            if keep:
+                self._matrix = np.vstack([vectors[i] for i in keep])
+                self._payloads = [json.loads(rows[i][1]) for i in keep]
+        except Exception as e:
+            print(f"Could not load semantic cache {self.name}: {e}")
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, vector) -> Optional[Dict]:
+        """Return the stored result of the most similar past input above the threshold"""
+        query = self._normalize(vector)
+        with self._lock:
+            if not self._payloads or self._matrix.shape[1] != query.shape[0]:
+                return None
+            similarities = self._matrix @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return self._payloads[best]
+        return None
+
+    def add(self, vector, payload: Dict):
+        """Remember a result for an input embedding and persist the entry"""
+        row = self._normalize(vector)[np.newaxis, :]
+        with self._lock:
+            try:
+                if self._payloads and self._matrix.shape[1] != row.shape[1]:
+                    # Embedding model changed dimensions; start over rather than mix spaces
+                    self._matrix, self._payloads = np.zeros((0, 0), dtype=np.float32), []
+                    self._conn.execute("DELETE FROM semantic_entries WHERE name = ?", (self.name,))
+                self._conn.execute(
+                    "INSERT INTO semantic_entries (name, vector, payload) VALUES (?, ?, ?)",
+                    (self.name, row.tobytes(), json.dumps(payload))
+                )
+                self._conn.commit()
+            except Exception as e:
+                print(f"Could not save semantic cache {self.name}: {e}")
+            self._matrix = row if not self._payloads else np.vstack([self._matrix, row])
+            self._payloads.append(payload)
+
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+def get_response_cache() -> LLMResponseCache:
+    """Return the process-wide response cache, opening it on first use"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = LLMResponseCache()
+        return _response_cache
+
+_semantic_caches: Dict[str, SemanticCache] = {}
+_semantic_caches_lock = threading.Lock()
+
+def get_semantic_cache(name: str) -> SemanticCache:
+    """Return the process-wide semantic cache for a name, so every processor shares one matrix and lock"""
+    with _semantic_caches_lock:
+        if name not in _semantic_caches:
+            _semantic_caches[name] = SemanticCache(name)
+        return _semantic_caches[name]
+
+def _chat_request(model: str, messages: List[Dict], temperature: float,
+                  response_format: Optional[Dict], max_tokens: Optional[int]) -> Dict:
+    """Chat completion arguments; the response cache key is a hash of exactly these"""
+    return {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "response_format": response_format,
+        "max_tokens": max_tokens
+    }
+
+def lookup_cached_completion(model: str, messages: List[Dict], temperature: float,
+                             response_format: Optional[Dict] = None,
+                             max_tokens: Optional[int] = None) -> Optional[str]:
+    """Completion text already in the response cache for this request, or None; never calls the API"""
+    if temperature > config.LLM_CACHE_MAX_TEMPERATURE:
+        return None
+    cache = get_response_cache()
+    return cache.get(cache.make_key(**_chat_request(model, messages, temperature, response_format, max_tokens)))
+
+def cached_chat_completion(client, model: str, messages: List[Dict], temperature: float,
+                           response_format: Optional[Dict] = None,
+                           max_tokens: Optional[int] = None,
+                           limiter=None) -> str:
+    """
+    Run a chat completion through the response cache
+    Only near-deterministic requests (temperature <= LLM_CACHE_MAX_TEMPERATURE) are cached
+    Cache misses wait on the optional rate limiter before calling the API
+    """
+    request = _chat_request(model, messages, temperature, response_format, max_tokens)
+
+    cacheable = temperature <= config.LLM_CACHE_MAX_TEMPERATURE
+    if cacheable:
+        cache = get_response_cache()
+        key = cache.make_key(**request)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    if limiter:
+        limiter.acquire()
+    # Only pass optional arguments the caller actually set
+    response = client.chat.completions.create(**{k: v for k, v in request.items() if v is not None})
+    content = response.choices[0].message.content or ""
+
+    if cacheable and content:
+        cache.set(key, content)
+
+    return content
+
+async def cached_chat_completion_async(client, model: str, messages: List[Dict], temperature: float,
+                                       response_format: Optional[Dict] = None,
+                                       max_tokens: Optional[int] = None,
+                                       semaphore=None, limiter=None) -> str:
+    """
+    Async variant of cached_chat_completion for an AsyncOpenAI client
+    Cache hits return immediately; only real API calls wait on the optional semaphore and rate limiter
+    """
+    request = _chat_request(model, messages, temperature, response_format, max_tokens)
+
+    cacheable = temperature <= config.LLM_CACHE_MAX_TEMPERATURE
+    if cacheable:
+        cache = get_response_cache()
+        key = cache.make_key(**request)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    if limiter:
+        await limiter.acquire()
+    async with semaphore or contextlib.nullcontext():
+        response = await client.chat.completions.create(**{k: v for k, v in request.items() if v is not None})
+    content = response.choices[0].message.content or ""
+
+    if cacheable and content:
+        cache.set(key, content)
+
+    return content
@@ -0,0 +1,35 @@
+"""
+Shared OpenAI/OpenRouter clients
+One client (and so one pooled HTTP connection set) per API key for the whole process
+"""
+
+import atexit
+from functools import lru_cache
+from openai import AsyncOpenAI, OpenAI
+import config
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Return the process-wide OpenRouter client for an API key
+    Keep-alive connections are reused across every processor, scraper and analytics module
+    """
+    client = OpenAI(api_key=api_key, **_client_options())
+    atexit.register(client.close)
+    return client
+
+def async_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    Return a new async OpenRouter client for an API key
+    Async clients are bound to their event loop, so callers open one per run with async with
+    """
+    return AsyncOpenAI(api_key=api_key, **_client_options())
+
+def _client_options() -> dict:
+    """Connection settings shared by the sync and async clients"""
+    return {
+        'base_url': config.OPENROUTER_BASE_URL,
+        'default_headers': config.OPENROUTER_DEFAULT_HEADERS,
+        'timeout': config.OPENAI_TIMEOUT,
+        'max_retries': config.OPENAI_MAX_RETRIES,
+    }
@@ -8,8 +8,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import json
-from openai import OpenAI
-import os
+from core.openai_client import get_openai_client
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
 import plotly.express as px
@@ -28,10 +27,7 @@ class PredictiveAnalytics:
         # do not change this unless explicitly requested by the user
         self.model = "openai/gpt-4o"  # OpenRouter format for model
         # OpenRouter API setup using OPENAI2 secret
-        self.client = OpenAI(
-            api_key=os.environ.get("OPENAI2"),
-            base_url="https://openrouter.ai/api/v1"
-        )
+        self.client = get_openai_client(config.OPENAI2_API_KEY)
         
         # VC-focused analysis parameters
         self.target_sectors = config.TARGET_SUBSECTORS
@@ -284,7 +280,7 @@ class PredictiveAnalytics:
         prompt = f"""You are a climate tech VC analyst. Based on current Grid Modernization and Carbon Capture funding data, identify market gaps and investment opportunities.
 
 Current Market Data:
-{json.dumps(data_summary, indent=2)}
+{json.dumps(data_summary, separators=(',', ':'))}
 
 Analyze and provide:
 1. GAPS: Underinvested areas within Grid Modernization and Carbon Capture
@@ -3,7 +3,7 @@ Business logic for filtering and processing VC deal data
 Applies investment criteria and formats data for VC associate workflows
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import pandas as pd
 from core.funding_event import FundingEvent, FundingEventCollection
@@ -75,12 +75,18 @@ class VCDealProcessor:
         if not end_date:
             end_date = datetime.now().strftime('%Y-%m-%d')
         
+        # Bounds are parsed once, not once per event
+        try:
+            start_dt = datetime.fromisoformat(start_date)
+            end_dt = datetime.fromisoformat(end_date)
+        except ValueError:
+            # Invalid bounds filter nothing out
+            return FundingEventCollection(list(events.events))
+        
         filtered_events = []
         for event in events.events:
             try:
                 event_date = datetime.fromisoformat(event.published_date.split('T')[0])
-                start_dt = datetime.fromisoformat(start_date)
-                end_dt = datetime.fromisoformat(end_date)
                 
                 if start_dt <= event_date <= end_dt:
                     filtered_events.append(event)
@@ -116,17 +122,58 @@ class VCDealProcessor:
         ]
         return FundingEventCollection(filtered_events)
     
+    def apply_filters(self, events: FundingEventCollection,
+                      subsector: Optional[str] = None,
+                      stage: Optional[str] = None,
+                      date_range: Optional[Tuple[str, str]] = None,
+                      amount_range: Optional[Tuple[float, float]] = None) -> FundingEventCollection:
+        """
+        Apply every dashboard filter in a single pass over the events
+        Same rules as the individual filter_by_* methods, without an intermediate collection per filter
+        """
+        if (subsector and subsector not in self.target_subsectors) or (stage and stage not in self.target_stages):
+            return FundingEventCollection([])
+        
+        start_dt = end_dt = None
+        if date_range:
+            try:
+                start_dt = datetime.fromisoformat(date_range[0])
+                end_dt = datetime.fromisoformat(date_range[1])
+            except ValueError:
+                # Invalid bounds filter nothing out
+                start_dt = end_dt = None
+        
+        filtered_events = []
+        for event in events.events:
+            if subsector and event.subsector != subsector:
+                continue
+            if stage and event.funding_stage != stage:
+                continue
+            if amount_range and not (amount_range[0] <= event.amount_raised <= amount_range[1]):
+                continue
+            if start_dt is not None:
+                try:
+                    event_date = datetime.fromisoformat(event.published_date.split('T')[0])
+                    if not (start_dt <= event_date <= end_dt):
+                        continue
+                except (ValueError, AttributeError):
+                    # Include events with invalid dates (don't filter out)
+                    pass
+            filtered_events.append(event)
+        
+        return FundingEventCollection(filtered_events)
+    
     def prioritize_by_lead_investor(self, events: FundingEventCollection,
                                   priority_investors: List[str]) -> List[FundingEvent]:
         """Prioritize deals by strategic lead investors"""
         priority_deals = []
         regular_deals = []
+        # Lowercased once, not once per event
+        priority_needles = [investor.lower() for investor in priority_investors]
         
         for event in events.events:
-            is_priority = any(
-                investor.lower() in event.lead_investor.lower() 
-                for investor in priority_investors
-            )
+            lead_investor = event.lead_investor.lower()
+            is_priority = any(needle in lead_investor for needle in priority_needles)
             
             if is_priority:
                 priority_deals.append(event)
@@ -266,18 +313,20 @@ class VCDealProcessor:
         
         # Convert to DataFrame for analysis
         df = events.to_dataframe()
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        df['date'] = pd.to_datetime(df['date'], errors='coerce', format='ISO8601')
         df = df.dropna(subset=['date'])
         
         if df.empty:
             return {'signals': [], 'trends': [], 'note': 'No valid date data'}
         
         # Recent activity surge
-        recent_30d = df[df['date'] >= (datetime.now() - timedelta(days=30))]
-        previous_30d = df[(df['date'] >= (datetime.now() - timedelta(days=60))) & 
-                         (df['date'] < (datetime.now() - timedelta(days=30)))]
+        # Window bounds as Timestamps, fixed once: native datetime64 comparisons, counted without slicing the frame
+        recent_start = pd.Timestamp.now() - pd.Timedelta(days=30)
+        previous_start = recent_start - pd.Timedelta(days=30)
+        recent_30d = int((df['date'] >= recent_start).sum())
+        previous_30d = int(((df['date'] >= previous_start) & (df['date'] < recent_start)).sum())
         
-        if len(recent_30d) > len(previous_30d) * 1.5:
+        if recent_30d > previous_30d * 1.5:
             signals.append("Deal activity surge in last 30 days")
         
         # Large deal detection
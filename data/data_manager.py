@@ -13,8 +13,11 @@ class DataManager:
     def __init__(self):
         self.data_dir = config.DATA_DIRECTORY
         self.funding_file = os.path.join(self.data_dir, config.FUNDING_DATA_FILE)
+        # Typed binary copy of the cleaned CSV; rebuilt whenever the CSV is newer
+        self.funding_cache_file = os.path.splitext(self.funding_file)[0] + ".parquet"
         self.metadata_file = os.path.join(self.data_dir, config.METADATA_FILE)
         self.processed_urls_file = os.path.join(self.data_dir, "processed_urls.log")
+        self._processed_urls: Optional[Set[str]] = None  # Loaded from the log on first use
         self._ensure_data_directory()
     
     def _ensure_data_directory(self):
@@ -22,22 +25,39 @@ class DataManager:
             os.makedirs(self.data_dir)
     
     def load_processed_urls(self) -> Set[str]:
+        """Return the live set of processed URLs; the log file is read once per DataManager"""
+        if self._processed_urls is not None:
+            return self._processed_urls
+        
+        self._processed_urls = set()
         if not os.path.exists(self.processed_urls_file):
-            return set()
+            return self._processed_urls
         try:
             with open(self.processed_urls_file, 'r', encoding='utf-8') as f:
-                return set(line.strip() for line in f)
+                self._processed_urls.update(line.strip() for line in f if line.strip())
         except Exception as e:
             print(f"   -> 🔴 Could not load processed URLs file: {e}")
-            return set()
+        return self._processed_urls
 
     def add_processed_url(self, url: str):
+        processed_urls = self.load_processed_urls()
+        if url in processed_urls:
+            return  # Already logged; keep the file free of duplicates
         try:
             with open(self.processed_urls_file, 'a', encoding='utf-8') as f:
                 f.write(f"{url}\n")
+            processed_urls.add(url)
         except Exception as e:
             print(f"   -> 🔴 Could not write to processed URLs file: {e}")
 
+    def clear_data(self):
+        """Delete stored deals, their typed cache and the processed-URL log"""
+        # This manager outlives reruns, so forget the loaded URL set too; the next scan re-reads the log
+        self._processed_urls = None
+        for path in (self.funding_file, self.funding_cache_file, self.processed_urls_file):
+            if os.path.exists(path):
+                os.remove(path)
+
     def save_funding_data(self, funding_events: List[Dict]):
         if not funding_events:
             return
@@ -64,6 +84,10 @@ class DataManager:
         """Load funding data from CSV file with proactive cleaning."""
         try:
             if os.path.exists(self.funding_file):
+                cached_df = self._load_funding_cache()
+                if cached_df is not None:
+                    return cached_df
+                
                 df = pd.read_csv(self.funding_file)
                 
                 # --- THIS IS THE FIX ---
@@ -81,12 +105,14 @@ class DataManager:
                         df[col] = df[col].fillna('')
                 # --- END OF FIX ---
 
-                # Convert date columns
+                # Convert date columns; every writer stores ISO dates, so the format is given
+                # instead of letting pandas infer one
                 if 'date' in df.columns:
-                    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+                    df['date'] = pd.to_datetime(df['date'], errors='coerce', format='ISO8601')
                 if 'processed_date' in df.columns:
-                    df['processed_date'] = pd.to_datetime(df['processed_date'], errors='coerce')
+                    df['processed_date'] = pd.to_datetime(df['processed_date'], errors='coerce', format='ISO8601')
                 
+                self._write_funding_cache(df)
                 return df
             else:
                 return pd.DataFrame()
@@ -95,6 +121,23 @@ class DataManager:
             print(f"Error loading funding data: {str(e)}")
             return pd.DataFrame()
     
+    def _load_funding_cache(self) -> Optional[pd.DataFrame]:
+        """Cleaned frame from the Parquet cache, or None when it is missing or older than the CSV"""
+        try:
+            if (os.path.exists(self.funding_cache_file) and
+                    os.path.getmtime(self.funding_cache_file) > os.path.getmtime(self.funding_file)):
+                return pd.read_parquet(self.funding_cache_file, memory_map=True)
+        except Exception as e:
+            print(f"Error reading funding cache: {str(e)}")
+        return None
+    
+    def _write_funding_cache(self, df: pd.DataFrame):
+        """Store the cleaned frame as Parquet so the next load skips CSV parsing and date conversion"""
+        try:
+            df.to_parquet(self.funding_cache_file, index=False)
+        except Exception as e:
+            print(f"Error writing funding cache: {str(e)}")
+    
     def _update_metadata(self, new_events: int, total_events: int):
         """Update metadata file with latest information"""
         try:
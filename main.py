@@ -1,6 +1,7 @@
 import streamlit as st
-import time
 import os
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Enhanced modules for advanced analytics
@@ -14,14 +15,26 @@ from sources.scraper import scrape_ctvc_deals
 from data.data_manager import DataManager
 from data.vc_sample_data import create_focused_vc_sample_data
 from ui.dashboard import VCDashboard
+from utils import compact_funding_frame
+
+@st.cache_resource
+def get_data_manager() -> DataManager:
+    """Shared DataManager; keeps the processed-URL log in memory across reruns"""
+    return DataManager()
+
+@st.cache_resource
+def get_data_integrator() -> MultiSourceDataIntegrator:
+    """Shared integrator; its scraper's pooled HTTP session and API clients outlive a rerun"""
+    return MultiSourceDataIntegrator()
 
 def initialize_app():
     """Initialize enhanced application components"""
-    data_manager = DataManager()
+    data_manager = get_data_manager()
+    # Not cached: the constructor emits the dashboard styles, which must render every run
     dashboard = VCDashboard()
     
     # Enhanced analytics modules
-    data_integrator = MultiSourceDataIntegrator()
+    data_integrator = get_data_integrator()
     predictive_analytics = EnhancedPredictiveAnalytics()
     investor_intelligence = InvestorIntelligence()
     
@@ -54,7 +67,7 @@ def ingest_funding_data(data_manager, data_integrator=None) -> FundingEventColle
 
             if not new_deals_data:
                 status.update(label="Scan complete. No new deals found.", state="complete", expanded=False)
-                time.sleep(2)
+                flash_message('info', "Scan complete. No new deals found.")
                 return
 
     if not new_deals_data:
@@ -63,17 +76,39 @@ def ingest_funding_data(data_manager, data_integrator=None) -> FundingEventColle
 
     with st.spinner("Storing validated deals..."):
         data_manager.save_funding_data(new_deals_data)
-        st.success(f"✅ Added {len(new_deals_data)} new deals.")
-        time.sleep(2)
+        load_funding_frame.clear()
+        flash_message('success', f"✅ Added {len(new_deals_data)} new deals.")
         return load_existing_data(data_manager)
 
+@st.cache_data(ttl=600, show_spinner=False)
+def load_funding_frame(funding_file: str, file_mtime: float) -> pd.DataFrame:
+    """
+    Parsed funding CSV, cached across reruns
+    funding_file and file_mtime only key the cache so a new save is picked up; writers also clear it explicitly
+    Reads through the shared DataManager; compact dtypes shrink the copy the cache hands back on every rerun
+    """
+    return compact_funding_frame(get_data_manager().load_funding_data())
+
+def funding_file_mtime(data_manager) -> float:
+    """Modification time of the funding CSV, or 0 when it does not exist yet"""
+    path = data_manager.funding_file
+    return os.path.getmtime(path) if os.path.exists(path) else 0.0
+
+def flash_message(kind: str, message: str):
+    """
+    Queue a status message (st.success/info/error) for after the action block
+    Shown once below the action's spinners and status boxes rather than sleeping so it stays readable
+    """
+    st.session_state['flash_message'] = (kind, message)
+
 def load_existing_data(data_manager) -> FundingEventCollection:
     """Load existing funding data from storage"""
     try:
-        df = data_manager.load_funding_data()
+        df = load_funding_frame(data_manager.funding_file, funding_file_mtime(data_manager))
         if df.empty:
             return FundingEventCollection([])
-        events = [FundingEvent.from_dict(row.to_dict()) for _, row in df.iterrows()]
+        # Plain dict records: iterrows would build a Series per row on every rerun
+        events = [FundingEvent.from_dict(record) for record in df.to_dict('records')]
         return FundingEventCollection(events)
     except Exception as e:
         st.error(f"Error loading existing data: {e}")
@@ -95,45 +130,43 @@ def main():
         
         if st.button("🔎 Find New Deals", type="primary", key="sidebar_refresh"):
             st.session_state['action'] = 'refresh'
-            st.rerun()
         
         if st.button("📋 Load VC Sample Data", key="sidebar_sample"):
             st.session_state['action'] = 'load_sample'
-            st.rerun()
 
         st.subheader("⚠️ Danger Zone")
         if st.button("🗑️ Clear All Data"):
             st.session_state['action'] = 'clear_data'
-            st.rerun()
 
-    # Execute actions
+    # Execute actions in the run that requested them; the data below is loaded afterwards, so no rerun is needed
     action = st.session_state.get('action')
     
     if action == 'refresh':
         del st.session_state['action']
         events = ingest_funding_data(data_manager, data_integrator)
-        st.rerun()
 
     elif action == 'load_sample':
         del st.session_state['action']
         with st.spinner("Loading focused VC sample data..."):
             sample_events_data = create_focused_vc_sample_data()
             data_manager.save_funding_data(sample_events_data)
-            st.success("✅ Loaded 10 focused VC deals")
-        st.rerun()
+            load_funding_frame.clear()
+            flash_message('success', "✅ Loaded 10 focused VC deals")
 
     elif action == 'clear_data':
         del st.session_state['action']
         try:
-            if os.path.exists(data_manager.funding_file):
-                os.remove(data_manager.funding_file)
-            if os.path.exists(data_manager.processed_urls_file):
-                os.remove(data_manager.processed_urls_file)
-            st.success("✅ All local data cleared successfully!")
-            time.sleep(2)
+            data_manager.clear_data()
+            load_funding_frame.clear()
+            flash_message('success', "✅ All local data cleared successfully!")
         except Exception as e:
-            st.error(f"Error clearing data: {e}")
-        st.rerun()
+            flash_message('error', f"Error clearing data: {e}")
+
+    # Outcome of this run's action, shown once
+    flash = st.session_state.pop('flash_message', None)
+    if flash:
+        kind, message = flash
+        getattr(st, kind)(message)
 
     # Load data every run
     events = load_existing_data(data_manager)
@@ -144,14 +177,17 @@ def main():
         with st.spinner("Running enhanced predictive analytics and investor intelligence..."):
             df = events.to_dataframe()
 
-            forecast_results = predictive_analytics.enhanced_funding_forecast(df)
-            competitive_analysis = predictive_analytics.competitive_landscape_analysis(df)
-            investor_analysis = investor_intelligence.analyze_investor_ecosystem(df)
+            # Independent analyses run side by side, so the model fits overlap the gap-analysis LLM round trip
+            # None of them touch st.* or modify df, which is safe to share across the worker threads
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                forecast_results = executor.submit(predictive_analytics.enhanced_funding_forecast, df)
+                competitive_analysis = executor.submit(predictive_analytics.competitive_landscape_analysis, df)
+                investor_analysis = executor.submit(investor_intelligence.analyze_investor_ecosystem, df)
 
             st.session_state['enhanced_results'] = {
-                'forecast': forecast_results,
-                'competitive': competitive_analysis,
-                'investor': investor_analysis
+                'forecast': forecast_results.result(),
+                'competitive': competitive_analysis.result(),
+                'investor': investor_analysis.result()
             }
             st.success("✅ Enhanced analytics complete")
 
@@ -160,7 +196,7 @@ def main():
         'predictive_analytics': predictive_analytics,
         'investor_intelligence': investor_intelligence,
         'data_integrator': data_integrator
-    })
+    }, data_version=funding_file_mtime(data_manager))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
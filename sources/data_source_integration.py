@@ -10,7 +10,7 @@ import json
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from openai import OpenAI
+from core.openai_client import get_openai_client
 import config
 from sources.deployment_scraper import DeploymentReadyScraper
 
@@ -22,11 +22,7 @@ class MultiSourceDataIntegrator:
     
     def __init__(self):
         # AI client for data processing
-        self.client = OpenAI(
-            api_key=config.OPENAI2_API_KEY,
-            base_url=config.OPENROUTER_BASE_URL,
-            default_headers=config.OPENROUTER_DEFAULT_HEADERS,
-        )
+        self.client = get_openai_client(config.OPENAI2_API_KEY)
         
         # Core scraper
         self.scraper = DeploymentReadyScraper()
@@ -3,14 +3,21 @@ Deployment-ready scraper for climate tech funding data
 Uses requests + BeautifulSoup instead of Selenium for Replit compatibility
 """
 
-import requests
-import time
+import asyncio
+import html
 import json
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from openai import OpenAI
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
+from openai import AsyncOpenAI
 import config
-import trafilatura
+from utils import AsyncRateLimiter, create_http_session
+from core.openai_client import async_openai_client
+
+# Generic article/post containers on news listing pages
+ARTICLE_CONTAINERS = SoupStrainer(['article', 'div'], class_=lambda x: x and any(
+    term in x.lower() for term in ['post', 'article', 'story', 'news']
+))
 
 class DeploymentReadyScraper:
     """
@@ -19,20 +26,15 @@ class DeploymentReadyScraper:
     """
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = create_http_session({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive',
         })
         
-        # OpenRouter client for AI analysis
-        self.client = OpenAI(
-            api_key=config.OPENAI2_API_KEY,
-            base_url=config.OPENROUTER_BASE_URL,
-            default_headers=config.OPENROUTER_DEFAULT_HEADERS,
-        )
+        # WordPress category ids resolved from slugs, per site
+        self._wp_category_ids: Dict[str, Optional[int]] = {}
     
     def get_funding_articles(self, sources: List[str] = None) -> List[Dict]:
         """
@@ -46,38 +48,53 @@ class DeploymentReadyScraper:
                 "https://news.crunchbase.com/"
             ]
         
-        articles = []
-        for source in sources:
-            try:
+        return asyncio.run(self._get_funding_articles_async(sources))
+    
+    async def _get_funding_articles_async(self, sources: List[str]) -> List[Dict]:
+        """Fetch sources concurrently; each source is a different host so no per-request delay is needed"""
+        semaphore = asyncio.Semaphore(config.SCRAPE_MAX_CONCURRENCY)
+        
+        async def scrape(source: str) -> List[Dict]:
+            async with semaphore:
                 print(f"Scraping {source}...")
-                source_articles = self._scrape_source(source)
-                articles.extend(source_articles)
-                time.sleep(2)  # Rate limiting
-            except Exception as e:
-                print(f"Error scraping {source}: {e}")
+                return await asyncio.to_thread(self._scrape_source, source)
+        
+        results = await asyncio.gather(*[scrape(source) for source in sources], return_exceptions=True)
+        
+        articles = []
+        for source, result in zip(sources, results):
+            if isinstance(result, Exception):
+                print(f"Error scraping {source}: {result}")
                 continue
+            articles.extend(result)
         
         return articles
     
     def _scrape_source(self, url: str) -> List[Dict]:
         """Scrape articles from a single source"""
+        # Structured feed first; only parse HTML when the site has none
+        feed_articles = self._scrape_wordpress_feed(url)
+        if feed_articles:
+            return feed_articles
+        
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
             # Use trafilatura for better content extraction
+            # Imported here: it is only needed on this HTML fallback path and is slow to import
+            import trafilatura
             content = trafilatura.extract(response.text)
             if not content:
                 return []
             
             # Basic article parsing - can be enhanced per source
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Only article-like containers are built into the tree; the rest of the page is skipped
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=ARTICLE_CONTAINERS)
             articles = []
             
             # Generic article extraction (customize per source)
-            for article in soup.find_all(['article', 'div'], class_=lambda x: x and any(
-                term in x.lower() for term in ['post', 'article', 'story', 'news']
-            ))[:10]:  # Limit to 10 articles per source
+            for article in soup.find_all(ARTICLE_CONTAINERS)[:10]:  # Limit to 10 articles per source
                 
                 title_elem = article.find(['h1', 'h2', 'h3', 'a'])
                 if title_elem:
@@ -98,6 +115,56 @@ class DeploymentReadyScraper:
             print(f"Error scraping {url}: {e}")
             return []
     
+    def _scrape_wordpress_feed(self, url: str) -> List[Dict]:
+        """
+        Read a WordPress category page (e.g. TechCrunch) through the WP REST API
+        Returns [] when the URL is not a category page or the site exposes no API
+        """
+        parsed = urlparse(url)
+        parts = [part for part in parsed.path.split('/') if part]
+        if len(parts) != 2 or parts[0] != 'category':
+            return []
+        
+        api_base = f"{parsed.scheme}://{parsed.netloc}/wp-json/wp/v2"
+        
+        try:
+            cache_key = f"{parsed.netloc}/{parts[1]}"
+            if cache_key not in self._wp_category_ids:
+                response = self.session.get(f"{api_base}/categories", params={'slug': parts[1]}, timeout=config.REQUEST_TIMEOUT)
+                response.raise_for_status()
+                categories = response.json()
+                self._wp_category_ids[cache_key] = categories[0]['id'] if categories else None
+            
+            category_id = self._wp_category_ids[cache_key]
+            if category_id is None:
+                return []
+            
+            response = self.session.get(f"{api_base}/posts", params={
+                'categories': category_id,
+                'per_page': 10,
+                '_fields': 'title,link,excerpt'
+            }, timeout=config.REQUEST_TIMEOUT)
+            response.raise_for_status()
+            
+            articles = []
+            for post in response.json():
+                title = html.unescape(post.get('title', {}).get('rendered', ''))
+                if not self._is_potentially_relevant(title):
+                    continue
+                excerpt = BeautifulSoup(post.get('excerpt', {}).get('rendered', ''), 'html.parser').get_text(strip=True)
+                articles.append({
+                    'title': title,
+                    'url': post.get('link', url),
+                    'source': url,
+                    'content': html.unescape(excerpt)[:500]
+                })
+            
+            return articles
+            
+        except Exception as e:
+            print(f"WordPress feed unavailable for {url}: {e}")
+            return []
+    
     def _is_potentially_relevant(self, title: str) -> bool:
         """Quick relevance check for climate/funding keywords"""
         climate_keywords = ['climate', 'energy', 'carbon', 'grid', 'funding', 'raises', 'series', 'seed']
@@ -120,52 +187,41 @@ class DeploymentReadyScraper:
         Use AI to analyze articles for funding deals
         Deployment-ready with proper error handling
         """
-        deals = []
+        if not articles:
+            return []
+        return asyncio.run(self._analyze_for_funding_deals_async(articles))
+    
+    async def _analyze_for_funding_deals_async(self, articles: List[Dict]) -> List[Dict]:
+        """Analyze articles concurrently, bounded by a semaphore and a request rate limiter"""
+        semaphore = asyncio.Semaphore(config.LLM_MAX_CONCURRENCY)
+        limiter = AsyncRateLimiter(config.LLM_RATE_LIMIT, config.LLM_RATE_PERIOD)
         
-        for article in articles:
-            try:
-                # AI analysis using OpenRouter
-                analysis = self._ai_analyze_article(article)
-                if analysis and analysis.get('is_funding_deal'):
-                    deals.append({
-                        **article,
-                        'analysis': analysis
-                    })
-                    
-                time.sleep(1)  # Rate limiting for API calls
-                
-            except Exception as e:
-                print(f"Error analyzing article: {e}")
+        # Async client is bound to this event loop, so it lives for one run only
+        async with async_openai_client(config.OPENAI2_API_KEY) as client:
+            async def analyze(article: Dict) -> Optional[Dict]:
+                async with semaphore:
+                    await limiter.acquire()
+                    return await self._ai_analyze_article_async(client, article)
+            
+            results = await asyncio.gather(*[analyze(article) for article in articles], return_exceptions=True)
+        
+        deals = []
+        for article, analysis in zip(articles, results):
+            if isinstance(analysis, Exception):
+                print(f"Error analyzing article: {analysis}")
                 continue
+            if analysis and analysis.get('is_funding_deal'):
+                deals.append({
+                    **article,
+                    'analysis': analysis
+                })
         
         return deals
     
-    def _ai_analyze_article(self, article: Dict) -> Optional[Dict]:
+    async def _ai_analyze_article_async(self, client: AsyncOpenAI, article: Dict) -> Optional[Dict]:
         """AI analysis of article for funding information"""
         try:
-            prompt = f"""
-            Analyze this article for climate tech funding information:
-            
-            Title: {article['title']}
-            Content: {article['content']}
-            
-            Determine if this is about a climate tech funding round. Return JSON:
-            {{
-                "is_funding_deal": boolean,
-                "startup_name": "string or null",
-                "sector": "Grid Modernization|Carbon Capture|Other",
-                "stage": "Seed|Series A|Series B|Other",
-                "amount": "amount in millions or null",
-                "confidence": 0.0-1.0
-            }}
-            """
-            
-            response = self.client.chat.completions.create(
-                model="openai/gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
-                temperature=0.1
-            )
+            response = await client.chat.completions.create(**self._analysis_request(article))
             
             result = json.loads(response.choices[0].message.content)
             return result
@@ -173,6 +229,32 @@ class DeploymentReadyScraper:
         except Exception as e:
             print(f"AI analysis error: {e}")
             return None
+    
+    def _analysis_request(self, article: Dict) -> Dict:
+        """Chat completion arguments for funding analysis of one article"""
+        prompt = f"""
+        Analyze this article for climate tech funding information:
+        
+        Title: {article['title']}
+        Content: {article['content']}
+        
+        Determine if this is about a climate tech funding round. Return JSON:
+        {{
+            "is_funding_deal": boolean,
+            "startup_name": "string or null",
+            "sector": "Grid Modernization|Carbon Capture|Other",
+            "stage": "Seed|Series A|Series B|Other",
+            "amount": "amount in millions or null",
+            "confidence": 0.0-1.0
+        }}
+        """
+        
+        return {
+            "model": "openai/gpt-4o",
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 200,
+            "temperature": 0.1
+        }
 
 # Alternative fallback data sources for when scraping is limited
 def get_sample_funding_sources() -> List[Dict]:
@@ -0,0 +1,56 @@
+"""
+Behavior tests for the LLM response helpers in core/ai_processor.py
+"""
+
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.ai_processor import AIProcessor, _TopLevelJSONStream
+
+STREAMED_INSIGHTS = '{"trends": "Grid, storage }", "counts": {"seed": [1, 2]}, "ok": true, "last": 3.5}'
+
+def stream_pairs(text: str, chunk_size: int) -> list:
+    """Feed text to a fresh parser chunk_size characters at a time"""
+    parser = _TopLevelJSONStream()
+    pairs = []
+    for start in range(0, len(text), chunk_size):
+        pairs.extend(parser.feed(text[start:start + chunk_size]))
+    pairs.extend(parser.close())
+    return pairs
+
+def test_stream_one_character_chunks():
+    """A number is not emitted until the ',' or '}' after it arrives"""
+    assert stream_pairs(STREAMED_INSIGHTS, 1) == [
+        ('trends', 'Grid, storage }'),
+        ('counts', {'seed': [1, 2]}),
+        ('ok', True),
+        ('last', 3.5)
+    ]
+
+def test_stream_matches_whole_document():
+    """Chunking never changes the pairs"""
+    for chunk_size in (2, 3, 7, len(STREAMED_INSIGHTS)):
+        assert stream_pairs(STREAMED_INSIGHTS, chunk_size) == stream_pairs(STREAMED_INSIGHTS, 1)
+
+def test_stream_flushes_unterminated_final_value():
+    """close() emits a last pair whose closing brace never arrived"""
+    assert stream_pairs('{"a": 1.25e3', 1) == [('a', 1250.0)]
+
+def test_stage_matcher_resolves_single_stages():
+    """Common stage spellings resolve without an API call"""
+    match = AIProcessor._match_stage_locally
+    assert match(None, 'Pre-Seed') == 'Pre-Seed'
+    assert match(None, 'seed round') == 'Seed'
+    assert match(None, 'Series-B') == 'Series B'
+    assert match(None, 'late stage') == 'Growth'
+    assert match(None, '') == 'Unknown'
+
+def test_stage_matcher_leaves_ambiguous_text_to_llm():
+    """Text naming several stages, or a pre- round, returns None"""
+    match = AIProcessor._match_stage_locally
+    assert match(None, 'Series A seed extension') is None
+    assert match(None, 'Pre-Series A') is None
+    assert match(None, 'raised a round') is None
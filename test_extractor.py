@@ -0,0 +1,39 @@
+"""
+Behavior tests for confidence tiering in core/extractor.py
+"""
+
+import sys
+import os
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.extractor import CONFIDENCE_FIELDS, confidence_tiers
+
+def scored(score: float, **overrides) -> dict:
+    """Pre-extracted record with every field scored at score, then overrides applied"""
+    scores = {field: score for field in CONFIDENCE_FIELDS}
+    scores.update(overrides)
+    return {'is_target_deal': True, 'confidence_scores': scores}
+
+def test_confidence_tiers_buckets():
+    """High scores accept, any low score rejects, in-between is re-extracted"""
+    tiers = confidence_tiers([scored(0.95), scored(0.95, lead_investor=0.2), scored(0.7)])
+    assert list(tiers) == ['accept', 'reject', 'ambiguous']
+
+def test_confidence_tiers_subsector_threshold():
+    """Subsector must clear its stricter threshold to accept"""
+    assert list(confidence_tiers([scored(0.95, subsector=0.87)])) == ['ambiguous']
+
+def test_confidence_tiers_missing_scores_are_ambiguous():
+    """Missing or malformed scores never accept or reject"""
+    records = [
+        {'is_target_deal': True},
+        scored(0.95, amount_raised=None),
+        scored(0.95, lead_investor='high')
+    ]
+    assert list(confidence_tiers(records)) == ['ambiguous'] * 3
+
+def test_confidence_tiers_empty_batch():
+    """An empty batch gives an empty tier array"""
+    assert len(confidence_tiers([])) == 0
@@ -0,0 +1,29 @@
+"""
+Behavior tests for the funding frame helpers in utils.py
+"""
+
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the current directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils import compact_funding_frame, float64_amounts
+
+def test_compact_keeps_inexact_amounts_float64():
+    """Amounts float32 cannot hold exactly stay float64"""
+    df = compact_funding_frame(pd.DataFrame({'amount': [12.3, 4.5]}))
+    assert df['amount'].dtype == np.float64
+    assert df['amount'].tolist() == [12.3, 4.5]
+
+def test_float32_amounts_sum_exactly():
+    """Quarter-million amounts are stored as float32 but summed in float64"""
+    amounts = [float(250_000 * (i % 397 + 1)) for i in range(5000)]
+    df = compact_funding_frame(pd.DataFrame({'amount': amounts}))
+    assert df['amount'].dtype == np.float32
+    total = float64_amounts(df)['amount'].sum()
+    assert total == sum(amounts)
+    assert df['amount'].dtype == np.float32
@@ -8,13 +8,244 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import io
 import json
 
+import config
 from core.funding_event import FundingEventCollection
 from core.processor import VCDealProcessor
 from core.predictive_analytics import analyze_market_trends, generate_funding_predictions, identify_investment_gaps, create_predictive_visualizations
 from ui.filters import DealFilters
-from utils import format_currency, format_date
+from utils import format_currency, format_date, minify_css, compact_funding_frame, float64_amounts
+
+# Botanical theme, minified once at import
+DASHBOARD_CSS = minify_css("""
+<style>
+    /* Modern eco-conscious design system */
+    :root {
+        --forest-green: #1B4332;
+        --sage-green: #52796F;
+        --soft-mint: #A8DADC;
+        --warm-cream: #F1FAEE;
+        --earth-brown: #8B4513;
+        --ocean-blue: #457B9D;
+        --sunset-orange: #E76F51;
+        --golden-yellow: #F4A261;
+    }
+
+    .main-header {
+        background: linear-gradient(135deg, var(--forest-green) 0%, var(--sage-green) 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        color: white;
+        margin-bottom: 2rem;
+    }
+
+    .metric-card {
+        background: rgba(168, 218, 220, 0.15);
+        border-radius: 12px;
+        padding: 1.5rem;
+        border-left: 4px solid var(--sage-green);
+        backdrop-filter: blur(10px);
+    }
+
+    .deal-card {
+        background: linear-gradient(135deg, rgba(241, 250, 238, 0.8) 0%, rgba(168, 218, 220, 0.1) 100%);
+        border-radius: 12px;
+        padding: 1.2rem;
+        margin: 0.8rem 0;
+        border-left: 4px solid var(--ocean-blue);
+    }
+
+    .stTabs [data-baseweb="tab"] {
+        background: var(--warm-cream);
+        border-radius: 8px 8px 0 0;
+        color: var(--forest-green);
+        font-weight: 500;
+    }
+
+    .stTabs [data-baseweb="tab"][aria-selected="true"] {
+        background: var(--sage-green);
+        color: white;
+    }
+</style>
+""")
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_deal_aggregations(view_key, _df: pd.DataFrame) -> dict:
+    """
+    Grouped series for the Analytics and Trends tabs, computed once per filtered deal frame
+    view_key identifies the frame (data version plus filters), so reruns skip hashing it
+    """
+    df = float64_amounts(_df)
+    aggs = {}
+    # One notna pass over the guarded columns instead of an isna().all() scan per column
+    present = df[[c for c in ('sector', 'stage') if c in df.columns]].notna().any()
+    if present.get('sector', False):
+        # Pie slices are ordered by value, so the group keys need no sort
+        aggs['by_sector'] = df.groupby('sector', sort=False, observed=True)['amount'].sum().reset_index()
+    if present.get('stage', False):
+        aggs['by_stage'] = df.groupby('stage', observed=True)['amount'].sum().reset_index()
+    
+    if 'date' in df.columns:
+        dates = pd.to_datetime(df['date'], errors='coerce', format='ISO8601')
+        valid = dates.notna().to_numpy()
+        if valid.any():
+            # NumPy month truncation instead of Period objects; only the grouped months are turned into labels
+            dated = pd.DataFrame({
+                'month': dates.to_numpy()[valid].astype('datetime64[M]'),
+                'amount': df['amount'].to_numpy()[valid]
+            })
+            if 'sector' in df.columns:
+                # One (month, sector) pass feeds both trend tables; dropna=False keeps deals without a sector in the monthly totals
+                dated['sector'] = df['sector'].array[valid]
+                month_sector = dated.groupby(['month', 'sector'], observed=True, dropna=False)['amount'].agg(['sum', 'count'])
+                monthly_data = month_sector.groupby(level='month').sum()
+                
+                labelled = month_sector.index.get_level_values('sector').notna()
+                sector_trends = month_sector.loc[labelled, 'sum'].rename('amount').reset_index()
+                sector_trends['month'] = sector_trends['month'].dt.strftime('%Y-%m')
+                aggs['by_month_sector'] = sector_trends
+            else:
+                monthly_data = dated.groupby('month')['amount'].agg(['sum', 'count'])
+            
+            # Mean from sum and count instead of a third aggregation
+            monthly_data = monthly_data.reset_index()
+            monthly_data.columns = ['month', 'total_funding', 'deal_count']
+            monthly_data['avg_deal_size'] = monthly_data['total_funding'] / monthly_data['deal_count']
+            monthly_data['month'] = monthly_data['month'].dt.strftime('%Y-%m')
+            aggs['by_month'] = monthly_data
+    return aggs
+
+# Dashboard sections, one rendered per run
+DASHBOARD_VIEWS = [
+    "📊 Analytics", 
+    "📋 Deal List", 
+    "🤖 AI Insights", 
+    "📈 Trends",
+    "🔮 Enhanced Forecasting",
+    "🏢 Investor Intelligence",
+    "🎯 Matchmaking"
+]
+
+# Row counts offered by the Deal List pager
+DEAL_LIST_PAGE_SIZES = [25, 50, 100, 250]
+
+# Botanical chart theme shared by every figure below
+CHART_BACKGROUND = dict(plot_bgcolor='rgba(241, 250, 238, 0.8)', paper_bgcolor='rgba(0,0,0,0)')
+CHART_FONT = dict(family="Inter, sans-serif", color='#1B4332')
+
+# Figures are cached as plain dicts on the small aggregated frame that feeds them, so
+# reruns skip Plotly Express trace building and layout merging
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def sector_pie_figure(sector_data: pd.DataFrame) -> dict:
+    """Sector share pie for the Analytics tab"""
+    # --- THIS IS THE FIX ---
+    # We remove the hardcoded 'color_discrete_sequence'.
+    # Plotly will now automatically assign a unique color to every sector it finds.
+    fig = px.pie(
+        sector_data, 
+        values='amount', 
+        names='sector',
+        title="Distribution of Funding by Sector"
+        # No longer need: color_discrete_sequence=...
+    )
+    # --- END OF FIX ---
+    
+    fig.update_traces(
+        textposition='inside', 
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>Amount: %{value:$,.0f}<br>Percentage: %{percent}<extra></extra>'
+    )
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=CHART_FONT,
+        showlegend=False # The pie chart labels are now the legend
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def stage_bar_figure(stage_data: pd.DataFrame) -> dict:
+    """Funding-by-stage bar chart for the Analytics tab"""
+    fig = px.bar(
+        stage_data,
+        x='stage',
+        y='amount',
+        title="Funding Amount by Stage",
+        color='stage', # Color by stage name for clarity
+        color_discrete_sequence=px.colors.qualitative.Pastel # Use a pleasant, auto-scaling color scheme
+    )
+    fig.update_layout(
+        font=CHART_FONT,
+        **CHART_BACKGROUND
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def monthly_volume_figure(monthly_data: pd.DataFrame) -> dict:
+    """Monthly funding volume bar chart for the Trends tab"""
+    fig = px.bar(
+        monthly_data,
+        x='month',
+        y='total_funding',
+        title="Monthly Funding Volume",
+        color='total_funding',
+        color_continuous_scale=['#A8DADC', '#52796F', '#1B4332']
+    )
+    fig.update_layout(**CHART_BACKGROUND)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def monthly_deal_count_figure(monthly_data: pd.DataFrame) -> dict:
+    """Monthly deal count line for the Trends tab"""
+    fig = px.line(
+        monthly_data,
+        x='month',
+        y='deal_count',
+        title="Monthly Deal Count",
+        markers=True
+    )
+    fig.update_traces(line=dict(color='#1B4332', width=3))
+    fig.update_layout(**CHART_BACKGROUND)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def sector_trends_figure(sector_trends: pd.DataFrame) -> dict:
+    """Monthly funding by sector lines for the Trends tab"""
+    fig = px.line(
+        sector_trends,
+        x='month',
+        y='amount',
+        color='sector',
+        title="Funding Trends by Sector",
+        markers=True
+    )
+    fig.update_layout(**CHART_BACKGROUND)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def filtered_deal_frame(view_key, _events: FundingEventCollection) -> pd.DataFrame:
+    """Filtered events as a frame, built once per data version and filter combination rather than on every view switch"""
+    # Same compact dtypes as the stored frame: label columns group and compare on integer codes
+    return compact_funding_frame(_events.to_dataframe())
+
+@st.cache_data(ttl=config.AUTO_REFRESH_INTERVAL, show_spinner=False, max_entries=8)
+def deal_insights(view_key, _processor: VCDealProcessor, _events: FundingEventCollection) -> tuple:
+    """
+    Market signals and deal intelligence for the AI Insights view, keyed like compute_deal_aggregations
+    Both measure recent windows against today, so entries expire rather than living for the whole data version
+    """
+    return _processor.detect_market_signals(_events), _processor.generate_deal_intelligence(_events)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def deal_list_csv(view_key, _df: pd.DataFrame) -> bytes:
+    """Deal list CSV export, serialized once per filtered frame and keyed like compute_deal_aggregations"""
+    # Written straight into a bytes buffer rather than building a str and encoding a second copy
+    buffer = io.BytesIO()
+    _df.to_csv(buffer, index=False)
+    return buffer.getvalue()
 
 class VCDashboard:
     """
@@ -37,77 +268,31 @@ class VCDashboard:
         # Load custom CSS for botanical design
         self._load_custom_styles()
     
-    def render(self, events: FundingEventCollection, enhanced_components: dict = None):
-        """Render complete dashboard with enhanced analytics capabilities"""
+    def render(self, events: FundingEventCollection, enhanced_components: dict = None, data_version: float = None):
+        """
+        Render complete dashboard with enhanced analytics capabilities
+        data_version identifies the stored data behind events (e.g. its file mtime) so per-dataset work can be cached
+        """
         
         # Header
         self._render_header()
         
         # Sidebar filters and controls
-        filter_config = self._render_sidebar(events, enhanced_components)
+        filter_config = self._render_sidebar(events, enhanced_components, data_version)
         
         # Apply filters
         filtered_events = self._apply_filters(events, filter_config)
         
         # Main dashboard content
         if filtered_events.get_deal_count() > 0:
-            self._render_main_content(filtered_events, enhanced_components)
+            view_key = (data_version, tuple(sorted(filter_config.items()))) if data_version is not None else None
+            self._render_main_content(filtered_events, enhanced_components, view_key)
         else:
             self._render_empty_state()
     
     def _load_custom_styles(self):
         """Load botanical-themed CSS styles"""
-        st.markdown("""
-        <style>
-            /* Modern eco-conscious design system */
-            :root {
-                --forest-green: #1B4332;
-                --sage-green: #52796F;
-                --soft-mint: #A8DADC;
-                --warm-cream: #F1FAEE;
-                --earth-brown: #8B4513;
-                --ocean-blue: #457B9D;
-                --sunset-orange: #E76F51;
-                --golden-yellow: #F4A261;
-            }
-            
-            .main-header {
-                background: linear-gradient(135deg, var(--forest-green) 0%, var(--sage-green) 100%);
-                padding: 2rem;
-                border-radius: 15px;
-                color: white;
-                margin-bottom: 2rem;
-            }
-            
-            .metric-card {
-                background: rgba(168, 218, 220, 0.15);
-                border-radius: 12px;
-                padding: 1.5rem;
-                border-left: 4px solid var(--sage-green);
-                backdrop-filter: blur(10px);
-            }
-            
-            .deal-card {
-                background: linear-gradient(135deg, rgba(241, 250, 238, 0.8) 0%, rgba(168, 218, 220, 0.1) 100%);
-                border-radius: 12px;
-                padding: 1.2rem;
-                margin: 0.8rem 0;
-                border-left: 4px solid var(--ocean-blue);
-            }
-            
-            .stTabs [data-baseweb="tab"] {
-                background: var(--warm-cream);
-                border-radius: 8px 8px 0 0;
-                color: var(--forest-green);
-                font-weight: 500;
-            }
-            
-            .stTabs [data-baseweb="tab"][aria-selected="true"] {
-                background: var(--sage-green);
-                color: white;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
     
     def _render_header(self):
         """Render dashboard header"""
@@ -118,7 +303,8 @@ class VCDashboard:
         </div>
         """, unsafe_allow_html=True)
     
-    def _render_sidebar(self, events: FundingEventCollection, enhanced_components: dict = None) -> dict:
+    def _render_sidebar(self, events: FundingEventCollection, enhanced_components: dict = None,
+                        data_version: float = None) -> dict:
         """Render sidebar with enhanced controls and analytics options"""
         with st.sidebar:
             st.title("⚡ Climate VC Controls")
@@ -154,7 +340,7 @@ class VCDashboard:
             
             # Filters
             st.subheader("🎯 Deal Filters")
-            filter_config = self.filters.render_filter_controls(events)
+            filter_config = self.filters.render_filter_controls(events, data_version)
             
             # Quick actions
             st.subheader("⚡ Quick Actions")
@@ -201,76 +387,68 @@ class VCDashboard:
     
     def _apply_filters(self, events: FundingEventCollection, filter_config: dict) -> FundingEventCollection:
         """Apply user-selected filters to events"""
-        filtered = events
-        
-        # Subsector filter
-        if filter_config.get('subsector') and filter_config['subsector'] != 'All':
-            filtered = self.processor.filter_by_subsector(filtered, filter_config['subsector'])
-        
-        # Stage filter
-        if filter_config.get('stage') and filter_config['stage'] != 'All':
-            filtered = self.processor.filter_by_stage(filtered, filter_config['stage'])
-        
-        # Date range filter
+        date_range = None
         if filter_config.get('date_range'):
             start_date, end_date = filter_config['date_range']
-            filtered = self.processor.filter_by_date_range(
-                filtered, 
-                start_date.strftime('%Y-%m-%d'), 
-                end_date.strftime('%Y-%m-%d')
-            )
-        
-        # Amount range filter
-        if filter_config.get('amount_range'):
-            min_amount, max_amount = filter_config['amount_range']
-            filtered = self.processor.filter_by_amount_range(filtered, min_amount, max_amount)
-        
-        return filtered
+            date_range = (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+        
+        # All filters in one pass rather than a new collection per filter
+        return self.processor.apply_filters(
+            events,
+            subsector=filter_config.get('subsector') if filter_config.get('subsector') != 'All' else None,
+            stage=filter_config.get('stage') if filter_config.get('stage') != 'All' else None,
+            date_range=date_range,
+            amount_range=filter_config.get('amount_range')
+        )
     
-    def _render_main_content(self, events: FundingEventCollection, enhanced_components: dict = None):
+    def _render_main_content(self, events: FundingEventCollection, enhanced_components: dict = None, view_key=None):
         """Render main dashboard content with enhanced analytics capabilities"""
         
+        # One frame shared by the metrics and views; aggregates only for the chart views that use them
+        if view_key is not None:
+            df = filtered_deal_frame(view_key, events)
+        else:
+            df = compact_funding_frame(events.to_dataframe())
+        
         # Key metrics
-        self._render_key_metrics(events)
+        self._render_key_metrics(df)
         
-        # Enhanced tabbed interface
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
-            "📊 Analytics", 
-            "📋 Deal List", 
-            "🤖 AI Insights", 
-            "📈 Trends",
-            "🔮 Enhanced Forecasting",
-            "🏢 Investor Intelligence",
-            "🎯 Matchmaking"
-        ])
+        # A radio rather than st.tabs: every tab body runs on each rerun, only the selected view does here
+        view = st.radio("View", DASHBOARD_VIEWS, horizontal=True, key="active_view", label_visibility="collapsed")
         
-        with tab1:
-            self._render_analytics_tab(events)
+        if view == DASHBOARD_VIEWS[0]:
+            self._render_analytics_tab(events, compute_deal_aggregations(self._frame_key(df, view_key), df))
         
-        with tab2:
-            self._render_deal_list_tab(events)
+        elif view == DASHBOARD_VIEWS[1]:
+            self._render_deal_list_tab(df, view_key)
         
-        with tab3:
-            self._render_ai_insights_tab(events)
+        elif view == DASHBOARD_VIEWS[2]:
+            self._render_ai_insights_tab(events, self._frame_key(df, view_key))
         
-        with tab4:
-            self._render_trends_tab(events)
+        elif view == DASHBOARD_VIEWS[3]:
+            self._render_trends_tab(df, compute_deal_aggregations(self._frame_key(df, view_key), df))
         
-        with tab5:
+        elif view == DASHBOARD_VIEWS[4]:
             self._render_enhanced_forecasting_tab(events, enhanced_components)
         
-        with tab6:
+        elif view == DASHBOARD_VIEWS[5]:
             self._render_investor_intelligence_tab(events, enhanced_components)
         
-        with tab7:
+        elif view == DASHBOARD_VIEWS[6]:
             self._render_matchmaking_tab(events, enhanced_components)
     
-    def _render_key_metrics(self, events: FundingEventCollection):
+    def _render_key_metrics(self, df: pd.DataFrame):
         """Render key metrics cards"""
+        # Column reductions on the shared frame instead of one loop over the events per metric
+        deal_count = len(df)
+        total_funding = float(df['amount'].astype('float64').sum()) if deal_count else 0.0
+        investors = df['lead_investor'] if deal_count else pd.Series(dtype=object)
+        # Compared rather than cast to bool so a categorical column with missing values masks cleanly
+        unique_investors = int(investors[investors != ''].nunique())
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_funding = events.get_total_funding()
             st.metric(
                 "💰 Total Deal Volume",
                 format_currency(total_funding),
@@ -278,7 +456,6 @@ class VCDashboard:
             )
         
         with col2:
-            deal_count = events.get_deal_count()
             st.metric(
                 "📊 Deal Count", 
                 deal_count,
@@ -294,71 +471,40 @@ class VCDashboard:
             )
         
         with col4:
-            unique_investors = len(events.get_unique_investors())
             st.metric(
                 "🏢 Active Investors",
                 unique_investors,
                 help="Number of unique lead investors"
             )
     
-    def _render_analytics_tab(self, events: FundingEventCollection):
+    def _frame_key(self, df: pd.DataFrame, view_key=None):
+        """Cache key for per-frame work: the data version and filters, or the frame's contents when the version is unknown"""
+        if view_key is None:
+            view_key = int(pd.util.hash_pandas_object(df, index=False).sum())
+        return view_key
+    
+    def _render_analytics_tab(self, events: FundingEventCollection, aggs: dict):
         """Render analytics visualizations"""
         st.subheader("📊 Deal Flow Analytics")
         
-        df = events.to_dataframe()
-        
         col1, col2 = st.columns(2)
         
         with col1:
             # Sector distribution
-            if 'sector' in df.columns and not df['sector'].isna().all():
+            if 'by_sector' in aggs:
                 st.subheader("🌱 Funding by Sector")
-                sector_data = df.groupby('sector')['amount'].sum().reset_index()
-                
-                # --- THIS IS THE FIX ---
-                # We remove the hardcoded 'color_discrete_sequence'.
-                # Plotly will now automatically assign a unique color to every sector it finds.
-                fig = px.pie(
-                    sector_data, 
-                    values='amount', 
-                    names='sector',
-                    title="Distribution of Funding by Sector"
-                    # No longer need: color_discrete_sequence=...
-                )
-                # --- END OF FIX ---
-
-                fig.update_traces(
-                    textposition='inside', 
-                    textinfo='percent+label',
-                    hovertemplate='<b>%{label}</b><br>Amount: %{value:$,.0f}<br>Percentage: %{percent}<extra></extra>'
-                )
-                fig.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(family="Inter, sans-serif", color='#1B4332'),
-                    showlegend=False # The pie chart labels are now the legend
-                )
+                sector_data = aggs['by_sector']
+                
+                fig = sector_pie_figure(sector_data)
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Stage distribution
-            if 'stage' in df.columns and not df['stage'].isna().all():
+            if 'by_stage' in aggs:
                 st.subheader("🌿 Funding by Stage")
-                stage_data = df.groupby('stage')['amount'].sum().reset_index()
-                
-                fig = px.bar(
-                    stage_data,
-                    x='stage',
-                    y='amount',
-                    title="Funding Amount by Stage",
-                    color='stage', # Color by stage name for clarity
-                    color_discrete_sequence=px.colors.qualitative.Pastel # Use a pleasant, auto-scaling color scheme
-                )
-                fig.update_layout(
-                    plot_bgcolor='rgba(241, 250, 238, 0.8)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(family="Inter, sans-serif", color='#1B4332')
-                )
+                stage_data = aggs['by_stage']
+                
+                fig = stage_bar_figure(stage_data)
                 st.plotly_chart(fig, use_container_width=True)
         
         # Deal intelligence summary (no changes needed here)
@@ -381,70 +527,65 @@ class VCDashboard:
                 for deal in intelligence['top_deals'][:5]:
                     st.write(f"• {deal}")
     
-    def _render_deal_list_tab(self, events: FundingEventCollection):
+    def _render_deal_list_tab(self, df: pd.DataFrame, view_key=None):
         """Render detailed deal list"""
         st.subheader("📋 VC Deal Flow Report")
         
-        df = events.to_dataframe()
-        
         if not df.empty:
             # Configure display columns for VC use case
             display_columns = ['company', 'lead_investor', 'amount', 'stage', 'sector', 'region', 'date']
             display_columns = [col for col in display_columns if col in df.columns]
             
             if display_columns:
-                display_df = df[display_columns].copy()
-                
-                # Rename columns for VC context
-                column_mapping = {
+                # Labels and number formatting are applied by the frontend, so the frame is not copied or formatted row by row
+                column_config = {
                     'company': 'Startup',
                     'lead_investor': 'Lead Investor',
-                    'amount': 'Round Size ($M)',
+                    'amount': st.column_config.NumberColumn('Round Size ($M)', format="$%.1fM"),
                     'stage': 'Stage',
                     'sector': 'Subsector',
                     'region': 'Region',
                     'date': 'Date'
                 }
-                display_df = display_df.rename(columns=column_mapping)
-                
-                # Format amount column
-                if 'Round Size ($M)' in display_df.columns:
-                    display_df['Round Size ($M)'] = display_df['Round Size ($M)'].apply(
-                        lambda x: f"${x:.1f}M" if pd.notnull(x) else ""
-                    )
                 
-                # Sort by date and amount
-                if 'Date' in display_df.columns:
-                    display_df = display_df.sort_values(['Date'], ascending=False)
+                # Newest first; only the current page's rows and columns are copied and sent to the browser
+                order = df['date'].sort_values(ascending=False).index if 'date' in df.columns else df.index
+                page_col1, page_col2 = st.columns(2)
+                with page_col1:
+                    page_size = st.selectbox("Rows per page", DEAL_LIST_PAGE_SIZES, index=1)
+                page_count = max(1, -(-len(df) // page_size))
+                with page_col2:
+                    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+                st.caption(f"Showing page {page} of {page_count} ({len(df)} deals)")
                 
                 st.dataframe(
-                    display_df,
+                    df.loc[order[(page - 1) * page_size:page * page_size], display_columns],
+                    column_config=column_config,
                     use_container_width=True,
                     hide_index=True
                 )
                 
-                # Export functionality
-                if st.button("📥 Export Deal List", key="export_deals"):
-                    csv = df.to_csv(index=False)
-                    st.download_button(
-                        label="Download CSV",
-                        data=csv,
-                        file_name=f"vc_deals_{datetime.now().strftime('%Y%m%d')}.csv",
-                        mime="text/csv",
-                        key="download_csv"
-                    )
+                # Export functionality: one click, with the CSV cached per filtered frame
+                st.download_button(
+                    label="📥 Export Deal List",
+                    data=deal_list_csv(self._frame_key(df, view_key), df),
+                    file_name=f"vc_deals_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv",
+                    key="download_csv",
+                    on_click="ignore"
+                )
             else:
                 st.info("No deal data available to display")
         else:
             st.info("No deals found with current filters")
     
-    def _render_ai_insights_tab(self, events: FundingEventCollection):
+    def _render_ai_insights_tab(self, events: FundingEventCollection, view_key=None):
         """Render AI-generated insights"""
         st.subheader("🤖 AI Deal Intelligence")
         
         if events.get_deal_count() > 0:
-            # Generate market signals
-            signals = self.processor.detect_market_signals(events)
+            # Market signals and deal intelligence, computed once per data version and filters
+            signals, intelligence = deal_insights(view_key, self.processor, events)
             
             col1, col2 = st.columns(2)
             
@@ -465,8 +606,6 @@ class VCDashboard:
                     st.write("No clear trends identified")
             
             # Deal intelligence
-            intelligence = self.processor.generate_deal_intelligence(events)
-            
             if 'investor_activity' in intelligence:
                 st.subheader("🏢 Investor Activity Analysis")
                 investor_data = intelligence['investor_activity']
@@ -485,75 +624,30 @@ class VCDashboard:
         else:
             st.info("Load deal data to see AI insights")
     
-    def _render_trends_tab(self, events: FundingEventCollection):
+    def _render_trends_tab(self, df: pd.DataFrame, aggs: dict):
         """Render trend analysis"""
         st.subheader("📈 Market Trends")
         
-        df = events.to_dataframe()
-        
         if not df.empty and 'date' in df.columns:
-            # Convert date column
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            df = df.dropna(subset=['date'])
-            
-            if not df.empty:
+            if 'by_month' in aggs:
                 # Monthly trends
-                df['month'] = df['date'].dt.to_period('M').astype(str)
-                monthly_data = df.groupby('month').agg({
-                    'amount': ['sum', 'count', 'mean']
-                }).reset_index()
-                monthly_data.columns = ['month', 'total_funding', 'deal_count', 'avg_deal_size']
+                monthly_data = aggs['by_month']
                 
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    fig = px.bar(
-                        monthly_data,
-                        x='month',
-                        y='total_funding',
-                        title="Monthly Funding Volume",
-                        color='total_funding',
-                        color_continuous_scale=['#A8DADC', '#52796F', '#1B4332']
-                    )
-                    fig.update_layout(
-                        plot_bgcolor='rgba(241, 250, 238, 0.8)',
-                        paper_bgcolor='rgba(0,0,0,0)'
-                    )
+                    fig = monthly_volume_figure(monthly_data)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 with col2:
-                    fig = px.line(
-                        monthly_data,
-                        x='month',
-                        y='deal_count',
-                        title="Monthly Deal Count",
-                        markers=True
-                    )
-                    fig.update_traces(line=dict(color='#1B4332', width=3))
-                    fig.update_layout(
-                        plot_bgcolor='rgba(241, 250, 238, 0.8)', 
-                        paper_bgcolor='rgba(0,0,0,0)'
-                    )
+                    fig = monthly_deal_count_figure(monthly_data)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 # Sector trends over time
-                if 'sector' in df.columns:
+                if 'by_month_sector' in aggs:
                     st.subheader("Sector Performance Over Time")
-                    sector_trends = df.groupby(['month', 'sector'])['amount'].sum().reset_index()
-                    # Ensure month column is string for JSON serialization
-                    sector_trends['month'] = sector_trends['month'].astype(str)
-                    fig = px.line(
-                        sector_trends,
-                        x='month',
-                        y='amount',
-                        color='sector',
-                        title="Funding Trends by Sector",
-                        markers=True
-                    )
-                    fig.update_layout(
-                        plot_bgcolor='rgba(241, 250, 238, 0.8)',
-                        paper_bgcolor='rgba(0,0,0,0)'
-                    )
+                    sector_trends = aggs['by_month_sector']
+                    fig = sector_trends_figure(sector_trends)
                     st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("Date information needed for trend analysis")
@@ -765,7 +859,8 @@ class VCDashboard:
         
         with col2:
             if st.button("📋 Load Sample VC Deals", type="primary", key="empty_load_sample"):
-                st.session_state['load_sample'] = True
+                # Actions are handled near the top of main(), so this late button needs one rerun to reach it
+                st.session_state['action'] = 'load_sample'
                 st.rerun()
             return
         
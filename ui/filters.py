@@ -5,9 +5,31 @@ Provides sector, stage, date, and amount filtering controls
 
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from core.funding_event import FundingEventCollection
 import pandas as pd 
+
+def collect_filter_options(events: FundingEventCollection) -> Dict:
+    """Positive amount bounds and sorted lead investors, gathered in a single loop over the events"""
+    amounts = []
+    investors = set()
+    for event in events.events:
+        if event.amount_raised > 0:
+            amounts.append(event.amount_raised)
+        if event.lead_investor and pd.notna(event.lead_investor):
+            investors.add(str(event.lead_investor))
+    
+    # Strings only, so sorting never mixes str and float/NaN
+    return {
+        'amount_bounds': (min(amounts), max(amounts)) if amounts else None,
+        'investors': sorted(investors)
+    }
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_filter_options(data_version: float, _events: FundingEventCollection) -> Dict:
+    """collect_filter_options cached per data version; _events is not hashed"""
+    return collect_filter_options(_events)
+
 class DealFilters:
     """
     Interactive filter controls for VC deal analysis
@@ -18,10 +40,15 @@ class DealFilters:
         self.target_subsectors = ["Grid Modernization", "Carbon Capture"]
         self.target_stages = ["Seed", "Series A"]
     
-    def render_filter_controls(self, events: FundingEventCollection) -> Dict:
+    def render_filter_controls(self, events: FundingEventCollection, data_version: float = None) -> Dict:
         """Render all filter controls and return filter configuration"""
         
         filter_config = {}
+        # Dropdown and slider choices come from the unfiltered events, once per data version when it is known
+        if data_version is not None:
+            options = load_filter_options(data_version, events)
+        else:
+            options = collect_filter_options(events)
         
         # Subsector filter
         filter_config['subsector'] = self._render_subsector_filter()
@@ -33,10 +60,10 @@ class DealFilters:
         filter_config['date_range'] = self._render_date_filter()
         
         # Amount range filter
-        filter_config['amount_range'] = self._render_amount_filter(events)
+        filter_config['amount_range'] = self._render_amount_filter(options['amount_bounds'])
         
         # Lead investor filter
-        filter_config['investor'] = self._render_investor_filter(events)
+        filter_config['investor'] = self._render_investor_filter(options['investors'])
         
         # Reset filters button
         if st.button("🔄 Reset All Filters"):
@@ -107,21 +134,14 @@ class DealFilters:
         
         return None
     
-    def _render_amount_filter(self, events: FundingEventCollection) -> Optional[Tuple[float, float]]:
+    def _render_amount_filter(self, amount_bounds: Optional[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
         """Render funding amount range filter"""
-        if events.get_deal_count() == 0:
+        if not amount_bounds:
             return None
         
         st.markdown("💵 **Funding Amount Range ($M)**")
         
-        # Get min/max from data
-        amounts = [event.amount_raised for event in events.events if event.amount_raised > 0]
-        
-        if not amounts:
-            return None
-        
-        min_amount = min(amounts)
-        max_amount = max(amounts)
+        min_amount, max_amount = amount_bounds
         
         # Create reasonable defaults
         default_min = max(0.5, min_amount)  # At least $500K
@@ -140,21 +160,11 @@ class DealFilters:
         return amount_range
 # In ui/filters.py
 
-    def _render_investor_filter(self, events: FundingEventCollection) -> Optional[str]:
+    def _render_investor_filter(self, investors: List[str]) -> Optional[str]:
         """Render lead investor filter"""
-        if events.get_deal_count() == 0:
-            return None
-        
-        investors = events.get_unique_investors()
-        
         if not investors:
             return None
         
-        # --- THIS IS THE FIX ---
-        # Convert all items to strings to prevent sorting errors with mixed types (str and float/NaN)
-        investors = sorted([str(i) for i in investors if pd.notna(i)])
-        # --- END FIX ---
-
         investor_options = ["All"] + investors
         
         selected_investor = st.selectbox(
@@ -1,9 +1,28 @@
 """Utility functions for the Climate Tech Funding Tracker"""
 
+import asyncio
 import re
+import threading
+import time
 from datetime import datetime
-from typing import Optional, Union
+from typing import Dict, Optional, Union
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import config
+
+# Patterns compiled once at import rather than looked up in re's cache on every call
+AMOUNT_WITH_UNIT_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(m|b|million|billion)')
+CURRENCY_SYMBOLS_PATTERN = re.compile(r'[$,€£,]')
+COMPANY_SUFFIX_PATTERN = re.compile(r'\s+(Inc\.?|LLC|Ltd\.?|Corp\.?|Corporation|Company)$', re.IGNORECASE)
+COMPANY_PREFIX_PATTERN = re.compile(r'^(The\s+)', re.IGNORECASE)
+# Million before billion, as before; the bare M/B forms are covered by IGNORECASE
+TEXT_AMOUNT_PATTERNS = [
+    re.compile(r'\$(\d+(?:\.\d+)?)\s*(million|M)\b', re.IGNORECASE),
+    re.compile(r'\$(\d+(?:\.\d+)?)\s*(billion|B)\b', re.IGNORECASE)
+]
 
 # --- NEW: Smart function to parse funding amount strings ---
 def parse_funding_amount(amount_str: Union[str, int, float]) -> float:
@@ -21,7 +40,7 @@ def parse_funding_amount(amount_str: Union[str, int, float]) -> float:
 
     # Regular expression to find the number and the unit (M or B)
     # Handles formats like: $10m, 10m, €10m, $10 million, 2.5b, etc.
-    match = re.search(r'(\d+(?:\.\d+)?)\s*(m|b|million|billion)', text)
+    match = AMOUNT_WITH_UNIT_PATTERN.search(text)
     
     if match:
         value = float(match.group(1))
@@ -35,7 +54,7 @@ def parse_funding_amount(amount_str: Union[str, int, float]) -> float:
     # Fallback for plain numbers, assume they are in millions
     try:
         # Remove currency symbols and commas
-        plain_number_str = re.sub(r'[$,€£,]', '', text)
+        plain_number_str = CURRENCY_SYMBOLS_PATTERN.sub('', text)
         return float(plain_number_str)
     except ValueError:
         return 0.0 # Return 0.0 if no number can be parsed
@@ -76,6 +95,60 @@ def format_date(date_input: Union[str, datetime, pd.Timestamp]) -> str:
     except (ValueError, TypeError):
         return "N/A"
 
+def format_currency_series(amounts: pd.Series) -> pd.Series:
+    """Vectorized format_currency: same output, with the scale for every row chosen in one pass"""
+    values = pd.to_numeric(amounts, errors='coerce').to_numpy(dtype=float)
+    conditions = [values >= 1e9, values >= 1e6, values >= 1e3]
+    divisors = np.select(conditions, [1e9, 1e6, 1e3], 1.0)
+    templates = np.select(conditions, ["${:.1f}B", "${:.1f}M", "${:.0f}K"], "${:,.0f}")
+    scaled = values / divisors
+    
+    formatted = [
+        "N/A" if np.isnan(value) else template.format(value)
+        for value, template in zip(scaled, templates)
+    ]
+    return pd.Series(formatted, index=amounts.index, dtype=object)
+
+def format_date_series(dates: pd.Series) -> pd.Series:
+    """Vectorized format_date for a datetime column"""
+    return pd.to_datetime(dates, errors='coerce').dt.strftime("%b %d, %Y").fillna("N/A")
+
+# Arrow-backed strings that keep NaN for missing values, like object columns (the pandas 3 default str dtype)
+ARROW_STRING_DTYPE = pd.StringDtype(storage='pyarrow', na_value=np.nan)
+
+def compact_funding_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast amounts, categorize label columns and Arrow-back the remaining text in place; returns df for chaining"""
+    if 'amount' in df.columns:
+        amounts = pd.to_numeric(df['amount'], errors='coerce')
+        # float32 halves the bytes every filter and aggregation reads, but only when every amount
+        # round-trips exactly: downcast='float' alone would turn 12.3 into 12.300000190734863
+        narrowed = amounts.astype('float32')
+        exact = np.array_equal(narrowed.to_numpy(dtype='float64'), amounts.to_numpy(dtype='float64'), equal_nan=True)
+        df['amount'] = narrowed if exact else amounts
+    for column in config.FUNDING_CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    # Free text (descriptions, URLs) as contiguous Arrow buffers instead of one Python str per cell
+    for column in df.select_dtypes(include='object').columns:
+        if pd.api.types.infer_dtype(df[column], skipna=True) == 'string':
+            df[column] = df[column].astype(ARROW_STRING_DTYPE)
+    return df
+
+def float64_amounts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    df with a float32 amount column widened back to float64 for summing
+    Each stored amount is exact, but float32 accumulation drifts by thousands of dollars over large totals
+    """
+    if 'amount' in df.columns and df['amount'].dtype == np.float32:
+        return df.assign(amount=df['amount'].astype('float64'))
+    return df
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a CSS block (shrinks the markdown payload sent each rerun)"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};])\s*', r'\1', css).strip()
+
 def clean_company_name(name: str) -> str:
     """Clean and standardize company names"""
     if not name or pd.isna(name):
@@ -83,8 +156,8 @@ def clean_company_name(name: str) -> str:
     
     # Remove common suffixes and prefixes
     name = str(name).strip()
-    name = re.sub(r'\s+(Inc\.?|LLC|Ltd\.?|Corp\.?|Corporation|Company)$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'^(The\s+)', '', name, flags=re.IGNORECASE)
+    name = COMPANY_SUFFIX_PATTERN.sub('', name)
+    name = COMPANY_PREFIX_PATTERN.sub('', name)
     
     # Clean up whitespace
     name = ' '.join(name.split())
@@ -113,15 +186,8 @@ def extract_amount_from_text(text: str) -> Optional[float]:
         return None
     
     # Look for patterns like "$50M", "$2.5B", "$100 million"
-    patterns = [
-        r'\$(\d+(?:\.\d+)?)\s*(million|M)\b',
-        r'\$(\d+(?:\.\d+)?)\s*(billion|B)\b',
-        r'\$(\d+(?:\.\d+)?)\s*M\b',
-        r'\$(\d+(?:\.\d+)?)\s*B\b'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in TEXT_AMOUNT_PATTERNS:
+        match = pattern.search(text)
         if match:
             value = float(match.group(1))
             unit = match.group(2).lower()
@@ -244,3 +310,68 @@ def get_time_period_label(start_date: datetime, end_date: datetime) -> str:
             return f"{start_date.strftime('%Y')} - {end_date.strftime('%Y')}"
     except:
         return "Custom Period"
+
+def create_http_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Create a requests session with a keep-alive connection pool and retry/backoff
+    Reuse one session per scraper so TCP/TLS handshakes are paid once per host
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    
+    adapter = HTTPAdapter(
+        pool_connections=config.HTTP_POOL_SIZE,
+        pool_maxsize=config.HTTP_POOL_SIZE,
+        max_retries=Retry(
+            total=config.HTTP_MAX_RETRIES,
+            backoff_factor=config.HTTP_BACKOFF_FACTOR,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"]
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+class AsyncRateLimiter:
+    """Token bucket allowing max_rate acquisitions per time_period seconds"""
+    
+    def __init__(self, max_rate: int, time_period: float):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * self.max_rate / self.time_period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+
+class RateLimiter:
+    """Thread-safe token bucket for sync callers, sharing AsyncRateLimiter's rate semantics"""
+    
+    def __init__(self, max_rate: int, time_period: float):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * self.max_rate / self.time_period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                time.sleep((1 - self._tokens) * self.time_period / self.max_rate)